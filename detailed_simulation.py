@@ -7,97 +7,84 @@ It shows the progress of each civilization over time.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from models import Universe, Civilization, CivilizationParams
-from simulation import UniverseVisualizer
-from tabulate import tabulate  # Make sure to install: pip install tabulate
+from models import Universe, Civilization, CivilizationParams, format_event_details
+
+# Fixed-width table layout for the per-step civilization status
+_TABLE_HEADERS = (
+    "Civilization",
+    "Stars",
+    "Population",
+    "Tech Level",
+    "Type",
+    "Motivation",
+)
+_COLUMN_WIDTHS = (16, 6, 10, 10, 22, 12)
+_ROW_FORMAT = " | ".join(f"{{:<{w}}}" for w in _COLUMN_WIDTHS)
+_SEPARATOR = "-+-".join("-" * w for w in _COLUMN_WIDTHS)
 
 
 def print_detailed_stats(universe, step):
     """Print detailed statistics about all civilizations"""
     print(f"\n======== STEP {step} (Date: {universe.current_date}) ========")
 
-    # Prepare data for tabulation
-    headers = [
-        "Civilization",
-        "Stars",
-        "Population",
-        "Tech Level",
-        "Type",
-        "Motivation",
-    ]
     rows = []
 
     # Total universe stats
     total_stars = len(universe.stars)
-    inhabited_stars = set()
-    for civ in universe.civilizations.values():
-        inhabited_stars.update(civ.visited_stars.keys())
+    num_inhabited = universe.count_inhabited_stars()
 
     print(
-        f"Universe: {len(inhabited_stars)}/{total_stars} stars inhabited ({len(inhabited_stars)/total_stars*100:.1f}%)"
+        f"Universe: {num_inhabited}/{total_stars} stars inhabited ({num_inhabited/total_stars*100:.1f}%)"
     )
 
+    # Format all populations and tech levels in one vectorized call each
+    civs = list(universe.civilizations.values())
+    populations = np.fromiter(
+        (civ.get_total_population() for civ in civs), dtype=np.float64, count=len(civs)
+    )
+    tech_levels = np.fromiter(
+        (civ.params.tech_level for civ in civs), dtype=np.float64, count=len(civs)
+    )
+    population_strs = np.char.mod("%.1e", populations)
+    tech_strs = np.char.mod("%.2f", tech_levels)
+
     # Per-civilization stats
-    for civ_id, civ in universe.civilizations.items():
+    for civ, population_str, tech_str in zip(civs, population_strs, tech_strs):
         # Get civilization details
-        name = civ.params.name
-        num_stars = len(civ.visited_stars)
-        population = civ.get_total_population()
-        tech_level = civ.params.tech_level
-        bio_type = civ.params.biological_type
-        org_type = civ.params.organization_type
-        motivation = civ.params.motivation
+        p = civ.params
 
         # Add to table
         rows.append(
             [
-                name,
-                num_stars,
-                f"{population:.1e}",
-                f"{tech_level:.2f}",
-                f"{bio_type}/{org_type}",
-                motivation,
+                p.name,
+                len(civ.visited_stars),
+                population_str,
+                tech_str,
+                f"{p.biological_type}/{p.organization_type}",
+                p.motivation,
             ]
         )
 
     # Print table
-    print(tabulate(rows, headers, tablefmt="grid"))
+    print(_ROW_FORMAT.format(*_TABLE_HEADERS))
+    print(_SEPARATOR)
+    for row in rows:
+        print(_ROW_FORMAT.format(*row))
 
-    # Recent events
+    # Recent events: the 2 most recent per civilization, newest 6 overall
     print("\nRecent events:")
-    event_count = 0
+    events = []
     for civ in universe.civilizations.values():
-        # Get the 2 most recent events for each civilization
-        recent_events = civ.history[-2:] if len(civ.history) >= 2 else civ.history
-        for event in recent_events:
-            event_count += 1
-            date = event["date"]
-            event_type = event["event"]
-            civ_name = civ.params.name
-
-            # Format event details based on type
-            details = ""
-            if event_type == "expansion":
-                from_star = event["data"].get("from_star", "unknown")
-                to_star = event["data"].get("to_star", "unknown")
-                details = f"expanded from star_{from_star[-1:]} to star_{to_star[-1:]}"
-            elif event_type == "tech_exchange":
-                with_civ = event["data"].get("with_civilization", "unknown")
-                boost = event["data"].get("tech_boost", 0)
-                details = f"gained {boost:.3f} tech from {with_civ}"
-            elif event_type == "conflict_won" or event_type == "conflict_lost":
-                against = event["data"].get("against_civilization", "unknown")
-                at_star = event["data"].get("at_star", "unknown")
-                details = f"{event_type} against {against} at star_{at_star[-1:]}"
-
-            print(f"  [{date:.0f}] {civ_name}: {event_type} - {details}")
-
-            # Limit to 6 total events to avoid too much output
-            if event_count >= 6:
-                break
-        if event_count >= 6:
-            break
+        civ_name = civ.params.name
+        events.extend(
+            (date, kind, payload, civ_name)
+            for date, kind, payload in civ.history.recent(2)
+        )
+    events.sort(key=lambda item: item[0], reverse=True)
+
+    for date, kind, payload, civ_name in events[:6]:
+        details = format_event_details(kind, payload)
+        print(f"  [{date:.0f}] {civ_name}: {kind.event_name} - {details}")
 
     print("\n")
 
@@ -108,7 +95,14 @@ def main():
     universe.initialize_stars(300)
 
     # Find a star with good resources for the first civilization
-    stars = sorted(universe.get_all_stars(), key=lambda s: s.resources, reverse=True)
+    # (only the top 21 stars are needed, so partition instead of a full sort)
+    all_stars = universe.get_all_stars()
+    resources = np.fromiter(
+        (s.resources for s in all_stars), dtype=np.float64, count=len(all_stars)
+    )
+    top_idx = np.argpartition(-resources, 20)[:21]
+    top_idx = top_idx[np.argsort(-resources[top_idx])]
+    stars = [all_stars[i] for i in top_idx]
     star1 = stars[0]
 
     # Create a cooperative, expansion-focused civilization
@@ -190,12 +184,11 @@ def main():
     print("Running simulation with detailed output every 10 steps...")
     total_steps = 200
 
-    for step in range(1, total_steps + 1):
-        universe.update()
+    for step in range(10, total_steps + 1, 10):
+        universe.run_simulation(10)
 
         # Print detailed stats every 10 steps
-        if step % 10 == 0:
-            print_detailed_stats(universe, step)
+        print_detailed_stats(universe, step)
 
     print("\n=== SIMULATION COMPLETE ===")
     print(f"Final date: {universe.current_date}")
@@ -203,17 +196,23 @@ def main():
 
     # Print final summary
     for civ_id, civ in universe.civilizations.items():
+        p = civ.params
         colony_count = len(civ.colonies)
-        max_pop_colony = max(civ.colonies.values()) if civ.colonies else 0
+        max_pop_colony = civ.get_largest_colony_population()
         total_pop = civ.get_total_population()
 
-        print(f"\n{civ.params.name}:")
+        print(f"\n{p.name}:")
         print(f"  Stars visited: {len(civ.visited_stars)}")
         print(f"  Active colonies: {colony_count}")
-        print(f"  Technology level: {civ.params.tech_level:.2f}")
+        print(f"  Technology level: {p.tech_level:.2f}")
         print(f"  Total population: {total_pop:.1e}")
         print(f"  Largest colony: {max_pop_colony:.1e}")
 
+    # Load matplotlib only now that plots are needed, so importing
+    # print_detailed_stats from this module stays cheap
+    import matplotlib.pyplot as plt
+    from simulation import UniverseVisualizer
+
     # Create visualizer
     visualizer = UniverseVisualizer(universe)
 
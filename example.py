@@ -6,10 +6,12 @@ This script shows a minimal example of setting up and running
 the interstellar civilization simulation.
 """
 
+import os
 import numpy as np
-import matplotlib.pyplot as plt
 from models import Universe, Civilization, CivilizationParams
-from simulation import UniverseVisualizer
+
+# Set ABM_HEADLESS=1 to run without a display (plots are built but not shown)
+HEADLESS = os.environ.get("ABM_HEADLESS") == "1"
 
 
 def main():
@@ -18,7 +20,14 @@ def main():
     universe.initialize_stars(300)
 
     # Find a star with good resources for the first civilization
-    stars = sorted(universe.get_all_stars(), key=lambda s: s.resources, reverse=True)
+    # (only the top 21 stars are needed, so partition instead of a full sort)
+    all_stars = universe.get_all_stars()
+    resources = np.fromiter(
+        (s.resources for s in all_stars), dtype=np.float64, count=len(all_stars)
+    )
+    top_idx = np.argpartition(-resources, 20)[:21]
+    top_idx = top_idx[np.argsort(-resources[top_idx])]
+    stars = [all_stars[i] for i in top_idx]
     star1 = stars[0]
 
     # Create a cooperative, expansion-focused civilization
@@ -94,20 +103,30 @@ def main():
 
     # Run the simulation for 200 steps
     print("Running simulation...")
-    for step in range(200):
-        universe.update()
-        if step % 50 == 0:
-            print(f"Step {step}, date: {universe.current_date}")
+    for step in range(0, 200, 50):
+        # Report the first step of each block of 50, as it completes
+        universe.run_simulation(1)
+        print(f"Step {step}, date: {universe.current_date}")
+        universe.run_simulation(49)
 
     print("\nSimulation complete!")
     print(f"Final date: {universe.current_date}")
     print(f"Active civilizations: {len(universe.civilizations)}")
 
     for civ_id, civ in universe.civilizations.items():
+        p = civ.params
         print(
-            f"{civ.params.name}: {len(civ.visited_stars)} stars, tech level {civ.params.tech_level:.2f}"
+            f"{p.name}: {len(civ.visited_stars)} stars, tech level {p.tech_level:.2f}"
         )
 
+    # Load matplotlib only now that plots are needed
+    import matplotlib
+
+    if HEADLESS:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from simulation import UniverseVisualizer
+
     # Create visualizer
     visualizer = UniverseVisualizer(universe)
 
@@ -120,7 +139,8 @@ def main():
     fig4, _ = visualizer.plot_expansion_history()
 
     # Show all plots
-    plt.show()
+    if not HEADLESS:
+        plt.show()
 
 
 if __name__ == "__main__":
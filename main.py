@@ -5,14 +5,34 @@ Interstellar Civilization Simulation
 This script runs a simulation of civilizations expanding across star systems.
 """
 
-import random
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
 from tqdm import tqdm
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 
 from models import Universe, Civilization, CivilizationParams
-from simulation import UniverseVisualizer
+
+# Parameters that create_civilization accepts as overrides
+_OVERRIDABLE_PARAMS = frozenset(
+    (
+        "population",
+        "reproduction_rate",
+        "individual_lifespan",
+        "expansion_rate",
+        "expansion_range",
+        "cooperation_factor",
+        "aggression_factor",
+        "founding_date",
+        "tech_level",
+        "tech_advancement_rate",
+        "time_horizon",
+        "biological_type",
+        "organization_type",
+        "motivation",
+        "expansions_per_tick",
+    )
+)
 
 
 def create_civilization(universe, id_num, name, star, **params):
@@ -29,37 +49,52 @@ def create_civilization(universe, id_num, name, star, **params):
     Returns:
         Civilization object
     """
-    # Default parameters
-    default_params = {
-        "population": 1e6,
-        "reproduction_rate": 0.01,
-        "individual_lifespan": 100,
-        "expansion_rate": 0.05,
-        "expansion_range": 100,
-        "cooperation_factor": 0.5,
-        "aggression_factor": 0.5,
-        "founding_date": universe.current_date,
-        "tech_level": 1.0,
-        "tech_advancement_rate": 0.005,
-        "time_horizon": 1000,
-        "biological_type": "biological",
-        "organization_type": "individual",
-        "motivation": "expansion",
-    }
-
-    # Override defaults with provided params
-    for key, value in params.items():
-        default_params[key] = value
-
-    # Create the civilization parameters
+    unknown = params.keys() - _OVERRIDABLE_PARAMS
+    if unknown:
+        raise TypeError(f"Unknown civilization parameters: {sorted(unknown)}")
+
+    # Fill each field directly from the overrides or its default
+    get = params.get
     civ_params = CivilizationParams(
-        id=f"civ_{id_num}", name=name, origin_star=star, **default_params
+        id=f"civ_{id_num}",
+        name=name,
+        origin_star=star,
+        population=get("population", 1e6),
+        reproduction_rate=get("reproduction_rate", 0.01),
+        individual_lifespan=get("individual_lifespan", 100),
+        expansion_rate=get("expansion_rate", 0.05),
+        expansion_range=get("expansion_range", 100),
+        cooperation_factor=get("cooperation_factor", 0.5),
+        aggression_factor=get("aggression_factor", 0.5),
+        founding_date=get("founding_date", universe.current_date),
+        tech_level=get("tech_level", 1.0),
+        tech_advancement_rate=get("tech_advancement_rate", 0.005),
+        time_horizon=get("time_horizon", 1000),
+        biological_type=get("biological_type", "biological"),
+        organization_type=get("organization_type", "individual"),
+        motivation=get("motivation", "expansion"),
+        expansions_per_tick=get("expansions_per_tick", 5),
     )
 
     # Create and return the civilization
     return Civilization(civ_params)
 
 
+def create_civilizations_batch(universe, configs):
+    """
+    Create many civilizations at once.
+
+    Args:
+        universe: Universe object
+        configs: List of dicts, each with "id_num", "name" and "star" keys plus
+            any parameter overrides accepted by create_civilization
+
+    Returns:
+        List of Civilization objects
+    """
+    return [create_civilization(universe, **config) for config in configs]
+
+
 def run_simulation(
     num_stars=1000,
     num_civs=5,
@@ -67,6 +102,8 @@ def run_simulation(
     universe_size=1000.0,
     show_plots=True,
     save_plots=False,
+    seed=None,
+    quiet=False,
 ):
     """
     Run the simulation with specified parameters.
@@ -78,70 +115,116 @@ def run_simulation(
         universe_size: Size of the universe cube
         show_plots: Whether to display plots
         save_plots: Whether to save plots to files
+        seed: Optional random seed for a reproducible run
+        quiet: Suppress progress output (e.g. inside ensemble workers)
+
+    Returns:
+        universe, visualizer: The simulated universe, and the visualizer used
+            for the plots (None if no plots were shown or saved)
     """
-    print(f"Initializing universe with {num_stars} stars...")
-    universe = Universe(size=universe_size)
+    # Independent random streams for the universe and the civilization draws
+    universe_seed, civ_seed = np.random.SeedSequence(seed).spawn(2)
+
+    if not quiet:
+        print(f"Initializing universe with {num_stars} stars...")
+    universe = Universe(size=universe_size, seed=universe_seed)
     universe.initialize_stars(num_stars)
 
-    print("Creating civilizations...")
+    # Rank stars by resources once; the star set is fixed after initialization
+    stars_list = universe.get_all_stars()
+    resources = np.fromiter(
+        (s.resources for s in stars_list), dtype=np.float64, count=len(stars_list)
+    )
+    top_k = min(20, len(stars_list))
+    top_idx = np.argpartition(-resources, top_k - 1)[:top_k]
+    candidate_stars = [stars_list[j] for j in top_idx]  # Top 20 stars by resources
+
+    if not quiet:
+        print("Creating civilizations...")
 
     # Motivation types with equal probability
-    motivation_types = ["expansion", "knowledge", "seeding", "resource"]
+    motivation_types = ("expansion", "knowledge", "seeding", "resource")
     # Organization types with equal probability
-    organization_types = ["individual", "hive", "singular"]
+    organization_types = ("individual", "hive", "singular")
     # Biological types with equal probability
-    biological_types = ["biological", "artificial", "hybrid"]
+    biological_types = ("biological", "artificial", "hybrid")
 
     # Civilization names (could be more creative in a real implementation)
     names = [f"Civilization {i+1}" for i in range(num_civs)]
 
+    # Draw every civilization's random parameters up front, one array per parameter
+    rng = np.random.default_rng(civ_seed)
+    origin_choices = rng.integers(0, len(candidate_stars), num_civs)
+    reproduction_rates = rng.uniform(0.005, 0.015, num_civs)
+    lifespans = rng.uniform(80, 120, num_civs)
+    expansion_rates = rng.uniform(0.03, 0.08, num_civs)
+    expansion_ranges = rng.uniform(80, 120, num_civs)
+    cooperation_factors = rng.uniform(0.3, 0.7, num_civs)
+    aggression_factors = rng.uniform(0.3, 0.7, num_civs)
+    tech_levels = rng.uniform(0.8, 1.2, num_civs)
+    tech_advancement_rates = rng.uniform(0.003, 0.008, num_civs)
+    time_horizons = rng.uniform(500, 1500, num_civs)
+    biological_choices = rng.integers(0, len(biological_types), num_civs)
+    organization_choices = rng.integers(0, len(organization_types), num_civs)
+    motivation_choices = rng.integers(0, len(motivation_types), num_civs)
+
     # Create civilizations with different parameters
-    for i in range(num_civs):
-        # Pick a random star with good resources for the origin
-        candidate_stars = sorted(
-            universe.get_all_stars(), key=lambda s: s.resources, reverse=True
-        )[
-            :20
-        ]  # Top 20 stars by resources
-        origin_star = random.choice(candidate_stars)
-
-        # Create civilization with random parameters
-        civ = create_civilization(
-            universe,
-            i + 1,
-            names[i],
-            origin_star,
+    configs = [
+        {
+            "id_num": i + 1,
+            "name": names[i],
+            # Pick a random star with good resources for the origin
+            "star": candidate_stars[origin_choices[i]],
             # Random parameters
-            reproduction_rate=random.uniform(0.005, 0.015),
-            individual_lifespan=random.uniform(80, 120),
-            expansion_rate=random.uniform(0.03, 0.08),
-            expansion_range=random.uniform(80, 120),
-            cooperation_factor=random.uniform(0.3, 0.7),
-            aggression_factor=random.uniform(0.3, 0.7),
-            tech_level=random.uniform(0.8, 1.2),
-            tech_advancement_rate=random.uniform(0.003, 0.008),
-            time_horizon=random.uniform(500, 1500),
-            biological_type=random.choice(biological_types),
-            organization_type=random.choice(organization_types),
-            motivation=random.choice(motivation_types),
-        )
-
-        # Add to universe
+            "reproduction_rate": float(reproduction_rates[i]),
+            "individual_lifespan": float(lifespans[i]),
+            "expansion_rate": float(expansion_rates[i]),
+            "expansion_range": float(expansion_ranges[i]),
+            "cooperation_factor": float(cooperation_factors[i]),
+            "aggression_factor": float(aggression_factors[i]),
+            "tech_level": float(tech_levels[i]),
+            "tech_advancement_rate": float(tech_advancement_rates[i]),
+            "time_horizon": float(time_horizons[i]),
+            "biological_type": biological_types[biological_choices[i]],
+            "organization_type": organization_types[organization_choices[i]],
+            "motivation": motivation_types[motivation_choices[i]],
+        }
+        for i in range(num_civs)
+    ]
+
+    # Add to universe
+    for civ in create_civilizations_batch(universe, configs):
         universe.add_civilization(civ)
 
-    print(f"Running simulation for {sim_steps} steps...")
-    # Run simulation with progress bar
-    for _ in tqdm(range(sim_steps)):
-        universe.update()
-
-    print("\nSimulation complete!")
-    print(f"Final date: {universe.current_date}")
-    print(f"Active civilizations: {len(universe.civilizations)}")
+    if not quiet:
+        print(f"Running simulation for {sim_steps} steps...")
+    # Run simulation in chunks so the progress bar is not touched every step;
+    # skip the bar entirely when stderr is not a terminal
+    chunk_size = 50
+    with tqdm(
+        total=sim_steps,
+        mininterval=1.0,
+        disable=quiet or not sys.stderr.isatty(),
+    ) as progress:
+        for start in range(0, sim_steps, chunk_size):
+            steps = min(chunk_size, sim_steps - start)
+            universe.run_simulation(steps)
+            progress.update(steps)
+
+    if not quiet:
+        print("\nSimulation complete!")
+        print(f"Final date: {universe.current_date}")
+        print(f"Active civilizations: {len(universe.civilizations)}")
+
+    # Without plots (e.g. in ensemble workers) matplotlib is never loaded
+    visualizer = None
+    if show_plots or save_plots:
+        # Create visualizer (imported here so matplotlib is only loaded once
+        # the backend has been chosen)
+        from simulation import UniverseVisualizer
 
-    # Create visualizer
-    visualizer = UniverseVisualizer(universe)
+        visualizer = UniverseVisualizer(universe)
 
-    if show_plots or save_plots:
         # Plot 3D state
         fig1, _ = visualizer.plot_3d_state()
         if save_plots:
@@ -168,11 +251,58 @@ def run_simulation(
             fig5.savefig("universe_statistics.png", dpi=300)
 
         if show_plots:
+            import matplotlib.pyplot as plt
+
             plt.show()
 
     return universe, visualizer
 
 
+def _run_one(job):
+    """Run one ensemble member in a worker process and return its summary"""
+    sim_kwargs, seed = job
+    universe, _ = run_simulation(
+        **sim_kwargs, show_plots=False, save_plots=False, seed=seed, quiet=True
+    )
+    tech_levels = [civ.params.tech_level for civ in universe.civilizations.values()]
+    return universe.current_date, len(universe.civilizations), tech_levels
+
+
+def run_ensemble(num_runs, workers=None, base_seed=0, **sim_kwargs):
+    """
+    Run independent simulations in parallel worker processes.
+
+    Args:
+        num_runs: Number of simulations in the ensemble
+        workers: Number of worker processes (defaults to the CPU count)
+        base_seed: Seed of the first run; run k uses base_seed + k
+        **sim_kwargs: Simulation parameters passed to run_simulation
+
+    Returns:
+        List of (final_date, active_civilizations, tech_levels) tuples, one per run
+    """
+    jobs = [(sim_kwargs, base_seed + k) for k in range(num_runs)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            tqdm(
+                executor.map(_run_one, jobs),
+                total=num_runs,
+                disable=not sys.stderr.isatty(),
+            )
+        )
+
+    active = np.array([num_active for _, num_active, _ in results])
+    tech = np.array([t for _, _, levels in results for t in levels])
+    print(f"\nEnsemble of {num_runs} runs complete!")
+    print(
+        f"Active civilizations: mean {active.mean():.2f}, min {active.min()}, max {active.max()}"
+    )
+    if tech.size:
+        print(f"Final tech level: median {np.median(tech):.2f}, max {tech.max():.2f}")
+
+    return results
+
+
 def main():
     """Main function to parse arguments and run the simulation"""
     parser = argparse.ArgumentParser(description="Interstellar Civilization Simulation")
@@ -188,9 +318,38 @@ def main():
     )
     parser.add_argument("--no-plots", action="store_true", help="Don't show plots")
     parser.add_argument("--save-plots", action="store_true", help="Save plots to files")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument(
+        "--ensemble",
+        type=int,
+        default=1,
+        help="Number of independent runs (more than 1 runs them in parallel without plots)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes for --ensemble"
+    )
 
     args = parser.parse_args()
 
+    if args.no_plots and args.save_plots and args.ensemble == 1:
+        # Figures are only saved, so skip initializing an interactive backend
+        # (runs without plots never load matplotlib at all)
+        import matplotlib
+
+        matplotlib.use("Agg")
+
+    if args.ensemble > 1:
+        run_ensemble(
+            args.ensemble,
+            workers=args.workers,
+            base_seed=args.seed or 0,
+            num_stars=args.stars,
+            num_civs=args.civs,
+            sim_steps=args.steps,
+            universe_size=args.size,
+        )
+        return
+
     # Run the simulation
     run_simulation(
         num_stars=args.stars,
@@ -199,6 +358,7 @@ def main():
         universe_size=args.size,
         show_plots=not args.no_plots,
         save_plots=args.save_plots,
+        seed=args.seed,
     )
 
 
@@ -1,5 +1,15 @@
 from .star import Star
 from .civilization import Civilization, CivilizationParams
+from .history import EventKind, HistoryBuffer, TimeSeriesBuffer, format_event_details
 from .universe import Universe
 
-__all__ = ["Star", "Civilization", "CivilizationParams", "Universe"]
+__all__ = [
+    "Star",
+    "Civilization",
+    "CivilizationParams",
+    "EventKind",
+    "HistoryBuffer",
+    "TimeSeriesBuffer",
+    "Universe",
+    "format_event_details",
+]
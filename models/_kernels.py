@@ -0,0 +1,72 @@
+"""
+Numeric kernels for the civilization update hot loops.
+
+When Numba is installed the kernels are JIT-compiled (and cached on disk, so
+the compile cost is only paid once per machine). Without Numba, equivalent
+vectorized NumPy versions are used instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
+
+
+def _update_populations_numpy(populations, resources, planets, growth_rate):
+    """Grow colony populations in place, clamp to carrying capacity, return total"""
+    populations *= 1.0 + growth_rate * resources
+    np.minimum(populations, resources * 1e9 * planets, out=populations)
+    return float(populations.sum())
+
+
+def _expansion_probabilities_numpy(
+    distances, resources, rate, inv_effective_range, motivation_mult, resource_filter
+):
+    """Probability of expanding to each candidate star"""
+    probabilities = rate * (1.0 - distances * inv_effective_range) * resources
+    probabilities *= motivation_mult
+    if resource_filter:
+        # Resource-focused civilizations mostly skip resource-poor stars
+        probabilities[resources < 0.6] *= 0.2
+    return probabilities
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def update_populations(populations, resources, planets, growth_rate):
+        """Grow colony populations in place, clamp to carrying capacity, return total"""
+        total = 0.0
+        for i in range(populations.size):
+            new = populations[i] * (1.0 + growth_rate * resources[i])
+            cap = resources[i] * 1e9 * planets[i]
+            if new > cap:
+                new = cap
+            populations[i] = new
+            total += new
+        return total
+
+    @njit(cache=True, fastmath=True)
+    def expansion_probabilities(
+        distances,
+        resources,
+        rate,
+        inv_effective_range,
+        motivation_mult,
+        resource_filter,
+    ):
+        """Probability of expanding to each candidate star"""
+        out = np.empty(distances.size)
+        for i in range(distances.size):
+            p = rate * (1.0 - distances[i] * inv_effective_range) * resources[i]
+            p *= motivation_mult
+            if resource_filter and resources[i] < 0.6:
+                p *= 0.2
+            out[i] = p
+        return out
+
+else:
+    update_populations = _update_populations_numpy
+    expansion_probabilities = _expansion_probabilities_numpy
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional, Set, Any
 import numpy as np
-import random
+from .colonies import ColonyMap
+from .history import EventKind, HistoryBuffer, TimeSeriesBuffer
+from ._kernels import expansion_probabilities, update_populations
 
 
 @dataclass
@@ -30,6 +32,8 @@ class CivilizationParams:
     biological_type: str  # 'biological', 'artificial', 'hybrid'
     organization_type: str  # 'individual', 'hive', 'singular'
     motivation: str  # 'expansion', 'knowledge', 'seeding', 'resource'
+    # Limits
+    expansions_per_tick: int = 5  # Maximum new stars settled per time step
 
 
 class Civilization:
@@ -40,33 +44,48 @@ class Civilization:
     changes over time as it grows, expands, and interacts with others.
     """
 
+    # Motivation effects, resolved once per civilization instead of every tick
+    _TECH_MOTIV_MULT = {"knowledge": 1.2}  # Knowledge-focused advance tech faster
+    _EXPAND_MOTIV_MULT = {"expansion": 1.5, "seeding": 1.3, "resource": 1.0}
+    # Resource-focused only expands to resource-rich stars
+    _RESOURCE_MOTIV_FILTER = {"resource": True}
+
     def __init__(self, params: CivilizationParams):
         self.params = params
-        self.visited_stars: Dict[str, float] = {
-            params.origin_star.id: params.founding_date
-        }
-        self.colonies: Dict[str, float] = {}  # Star ID -> population at that star
-        self.colonies[params.origin_star.id] = params.population
-        self.history: List[Dict[str, Any]] = []
-        self.tech_history: List[Tuple[float, float]] = [
-            (params.founding_date, params.tech_level)
-        ]
-        self.population_history: List[Tuple[float, float]] = [
-            (params.founding_date, params.population)
-        ]
+        self._tech_mult = self._TECH_MOTIV_MULT.get(params.motivation, 1.0)
+        self._expand_mult = self._EXPAND_MOTIV_MULT.get(params.motivation, 1.0)
+        self._resource_filter = self._RESOURCE_MOTIV_FILTER.get(
+            params.motivation, False
+        )
+        # Population growth is affected by reproduction rate and lifespan, which
+        # stay fixed for the life of the civilization
+        self._base_growth_rate = params.reproduction_rate - (
+            1 / params.individual_lifespan
+        )
+        self.visited_stars: Dict[str, float] = {}
+        # Star rows of visited stars, kept alongside visited_stars for NumPy indexing
+        self._visited_rows = np.empty(16, dtype=np.int32)
+        self._visited_count = 0
+        # Visited flag per star row, for branchless filtering of candidate stars
+        self._visited_mask = np.zeros(0, dtype=bool)
+        self.colonies = ColonyMap()  # Star ID -> population at that star
+        self.add_colony(params.origin_star, params.population)
+        self.history = HistoryBuffer()
+        self.tech_history = TimeSeriesBuffer()
+        self.tech_history.append(params.founding_date, params.tech_level)
+        self.population_history = TimeSeriesBuffer()
+        self.population_history.append(params.founding_date, params.population)
 
         # Record the initial visit to the origin star
-        params.origin_star.record_visit(params.id, params.founding_date)
+        self._record_visit(params.origin_star, params.founding_date)
 
         # Log founding event
         self._add_to_history(
             params.founding_date,
-            "founding",
-            {
-                "star": params.origin_star.id,
-                "tech_level": params.tech_level,
-                "population": params.population,
-            },
+            EventKind.FOUNDING,
+            params.origin_star.id,
+            params.tech_level,
+            params.population,
         )
 
     def update(self, current_date: float, universe: "Universe") -> None:
@@ -78,57 +97,37 @@ class Civilization:
 
     def _update_population(self, current_date: float, universe: "Universe") -> None:
         """Update population across all colonies"""
-        total_population = 0
-
-        # Update each colony's population
-        for star_id, population in list(self.colonies.items()):
-            # Get the star's resource level
-            star = universe.get_star(star_id)
-            if star is None:
-                continue
-
-            # Population growth is affected by reproduction rate, lifespan, and resources
-            growth_rate = self.params.reproduction_rate - (
-                1 / self.params.individual_lifespan
-            )
-
-            # Apply resource constraints - lower resources reduce growth
-            effective_growth_rate = growth_rate * star.resources
-
-            # Calculate new population
-            new_population = population * (1 + effective_growth_rate)
-
-            # Apply carrying capacity based on star resources
-            carrying_capacity = star.resources * 1e9 * star.planets
-            if new_population > carrying_capacity:
-                new_population = carrying_capacity
-
-            # Update the colony population
-            self.colonies[star_id] = new_population
-            total_population += new_population
+        # Work on all colonies at once: populations are a view into the colony
+        # arrays, and star data is gathered by each colony's star row
+        rows = self.colonies.star_rows
+
+        # Grow each colony from the base growth rate (lower resources reduce
+        # growth) and cap it at the carrying capacity based on star resources
+        total_population = update_populations(
+            self.colonies.populations,
+            universe._resources[rows],
+            universe._planets[rows],
+            self._base_growth_rate,
+        )
 
         # Update the main population parameter
         self.params.population = total_population
 
         # Record population history
-        self.population_history.append((current_date, total_population))
+        self.population_history.append(current_date, total_population)
 
     def _update_technology(self, current_date: float) -> None:
         """Update the civilization's technology level"""
-        # Basic technological advancement
+        # Basic technological advancement, adjusted based on motivation
         new_tech_level = self.params.tech_level * (
             1 + self.params.tech_advancement_rate
         )
-
-        # Adjust based on motivation
-        if self.params.motivation == "knowledge":
-            # Knowledge-focused civilizations advance tech faster
-            new_tech_level *= 1.2
+        new_tech_level *= self._tech_mult
 
         self.params.tech_level = new_tech_level
 
         # Record tech history
-        self.tech_history.append((current_date, new_tech_level))
+        self.tech_history.append(current_date, new_tech_level)
 
     def _expand_to_new_stars(self, current_date: float, universe: "Universe") -> None:
         """Attempt to expand to new stars based on expansion parameters"""
@@ -136,116 +135,146 @@ class Civilization:
         if current_date - self.params.founding_date < 10:  # Minimum establishment time
             return
 
-        # Try expansion from each visited star
-        for origin_star_id in list(self.visited_stars.keys()):
-            origin_star = universe.get_star(origin_star_id)
-            if origin_star is None:
-                continue
-
-            # Get candidate stars for expansion
-            candidate_stars = universe.get_nearby_stars(
-                position=origin_star.position,
-                range_limit=self.params.expansion_range * self.params.tech_level,
+        # Loop invariants: range, its inverse and the expansion rate are fixed
+        # for the whole call
+        effective_range = self.params.expansion_range * self.params.tech_level
+        # No star anywhere has a neighbour that close, so nothing can be reached
+        if effective_range < universe._min_star_distance:
+            return
+        inv_effective_range = 1.0 / effective_range
+        expansion_rate = self.params.expansion_rate
+        # Limit expansions per turn to prevent explosive growth
+        budget = self.params.expansions_per_tick
+        if budget <= 0:
+            return
+        nearest_distances = universe._nearest_distances
+        num_stars = len(universe._positions)
+        if len(self._visited_mask) < num_stars:
+            self._grow_visited_mask(num_stars)
+        # Hot attributes and methods, bound once for the loops below
+        visited_mask = self._visited_mask
+        resources = universe._resources
+        visitor_counts = universe._visitor_counts
+        get_star_by_row = universe.get_star_by_row
+        query_range = universe.query_range
+        colonies_get = self.colonies.get
+        add_colony = self.add_colony
+        record_visit = self._record_visit
+        add_to_history = self._add_to_history
+        expand_mult = self._expand_mult
+        resource_filter = self._resource_filter
+        draw = universe.random
+
+        # Only stars whose nearest neighbour is in range can be expansion
+        # origins, so select them all at once
+        origin_rows = self.visited_star_ids
+        origin_rows = origin_rows[nearest_distances[origin_rows] <= effective_range]
+
+        # Try expansion from each eligible star
+        for origin_row in origin_rows.tolist():
+            origin_star = get_star_by_row(origin_row)
+            origin_star_id = origin_star.id
+
+            # Get candidate stars (already within range) for expansion
+            rows, distances = query_range(
+                origin_star.position, effective_range, origin_row
             )
 
             # Filter out already visited stars
-            candidate_stars = [
-                s for s in candidate_stars if s.id not in self.visited_stars
-            ]
+            unvisited = ~visited_mask[rows]
+            rows = rows[unvisited]
+            distances = distances[unvisited]
 
             # No candidates, skip
-            if not candidate_stars:
+            if rows.size == 0:
                 continue
 
-            # Try to expand to each candidate based on expansion rate
-            for star in candidate_stars:
-                # Probability of successful expansion
-                distance = origin_star.distance_to(star)
-
-                # Skip if beyond range
-                if distance > self.params.expansion_range * self.params.tech_level:
-                    continue
+            # Probability of successful expansion, adjusted for tech level and
+            # distance, star resources and motivation
+            probabilities = expansion_probabilities(
+                distances,
+                resources[rows],
+                expansion_rate,
+                inv_effective_range,
+                expand_mult,
+                resource_filter,
+            )
 
-                # Adjust for tech level and distance
-                probability = self.params.expansion_rate * (
-                    1
-                    - distance / (self.params.expansion_range * self.params.tech_level)
+            # Attempt expansion to every candidate with one batched draw, then
+            # only visit the successful ones
+            successes = np.flatnonzero(draw(rows.size) < probabilities)
+            if successes.size > budget:
+                # Oversubscribed: keep the most likely successes, in row order
+                best = np.argsort(-probabilities[successes], kind="stable")[:budget]
+                successes = np.sort(successes[best])
+            budget -= successes.size
+
+            for row, distance in zip(
+                rows[successes].tolist(), distances[successes].tolist()
+            ):
+                star = get_star_by_row(row)
+
+                # Success! Mark star as visited
+                record_visit(star, current_date)
+                visitor_counts[row] += 1
+
+                # Establish a colony with a portion of the origin star's population
+                origin_population = colonies_get(origin_star_id, 0)
+                colony_size = origin_population * 0.1  # 10% of origin population
+                add_colony(origin_star, origin_population - colony_size)
+                add_colony(star, colony_size)
+
+                # Log the expansion
+                add_to_history(
+                    current_date,
+                    EventKind.EXPANSION,
+                    origin_star_id,
+                    star.id,
+                    distance,
+                    colony_size,
                 )
 
-                # Adjust for star resources
-                probability *= star.resources
-
-                # Adjust for motivation
-                if self.params.motivation == "expansion":
-                    probability *= 1.5
-                elif self.params.motivation == "seeding":
-                    probability *= 1.3
-                elif self.params.motivation == "resource":
-                    # Resource-focused only expands to resource-rich stars
-                    if star.resources < 0.6:
-                        probability *= 0.2
-
-                # Attempt expansion
-                if random.random() < probability:
-                    # Success! Mark star as visited
-                    self.visited_stars[star.id] = current_date
-                    star.record_visit(self.params.id, current_date)
-
-                    # Establish a colony with a portion of the origin star's population
-                    origin_population = self.colonies.get(origin_star_id, 0)
-                    colony_size = origin_population * 0.1  # 10% of origin population
-                    self.colonies[origin_star_id] = origin_population - colony_size
-                    self.colonies[star.id] = colony_size
-
-                    # Log the expansion
-                    self._add_to_history(
-                        current_date,
-                        "expansion",
-                        {
-                            "from_star": origin_star_id,
-                            "to_star": star.id,
-                            "distance": distance,
-                            "colony_size": colony_size,
-                        },
-                    )
-
-                    # Limit expansions per turn to prevent explosive growth
-                    if len(self.visited_stars) % 10 == 0:
-                        return
+            if budget == 0:
+                return
 
     def _interact_with_other_civilizations(
         self, current_date: float, universe: "Universe"
     ) -> None:
         """Handle interactions with other civilizations"""
-        # Check each star we've visited for other civilizations
-        for star_id in self.visited_stars:
-            star = universe.get_star(star_id)
-            if star is None:
-                continue
-
-            # Get other civilizations at this star
-            visitors = star.get_visiting_civilizations()
-
-            # Remove ourselves from the list
-            if self.params.id in visitors:
-                del visitors[self.params.id]
-
-            # No other civilizations here
-            if not visitors:
-                continue
-
-            # Interact with each other civilization
-            for other_civ_id, visit_date in visitors.items():
-                other_civ = universe.get_civilization(other_civ_id)
+        # Only stars where we have a colony and that some other civilization
+        # has also visited can host an interaction, so select those up front
+        rows = self.visited_star_ids
+        rows = rows[universe._visitor_counts[rows] > 1]
+        shared_rows = rows[np.isin(rows, self.colonies.star_rows)]
+
+        # Hot attributes, bound once for the loop below. The interaction type
+        # depends only on our (fixed) cooperation and aggression factors.
+        my_id = self.params.id
+        colonies = self.colonies
+        get_civilization = universe.get_civilization
+        get_star_by_row = universe.get_star_by_row
+        peaceful = self.params.cooperation_factor > self.params.aggression_factor
+
+        # Check each shared star for other civilizations
+        for row in shared_rows.tolist():
+            star = get_star_by_row(row)
+            star_id = star.id
+
+            # Interact with each other civilization at this star. The visitor
+            # dict is read in place, so we skip ourselves rather than copy it
+            for other_civ_id in star.get_visiting_civilizations():
+                if other_civ_id == my_id:
+                    continue
+                other_civ = get_civilization(other_civ_id)
                 if other_civ is None:
                     continue
 
                 # Both civilizations must be established at this star (not just passing through)
-                if star_id not in other_civ.colonies or star_id not in self.colonies:
+                if star_id not in other_civ.colonies or star_id not in colonies:
                     continue
 
                 # Determine interaction type based on cooperation and aggression factors
-                if self.params.cooperation_factor > self.params.aggression_factor:
+                if peaceful:
                     # Peaceful interaction
                     self._peaceful_interaction(current_date, other_civ, star)
                 else:
@@ -268,12 +297,10 @@ class Civilization:
 
             self._add_to_history(
                 current_date,
-                "tech_exchange",
-                {
-                    "with_civilization": other_civ.params.id,
-                    "at_star": star.id,
-                    "tech_boost": tech_boost,
-                },
+                EventKind.TECH_EXCHANGE,
+                other_civ.params.id,
+                star.id,
+                tech_boost,
             )
 
     def _hostile_interaction(
@@ -306,12 +333,10 @@ class Civilization:
 
             self._add_to_history(
                 current_date,
-                "conflict_won",
-                {
-                    "against_civilization": other_civ.params.id,
-                    "at_star": star.id,
-                    "captured_population": captured_population,
-                },
+                EventKind.CONFLICT_WON,
+                other_civ.params.id,
+                star.id,
+                captured_population,
             )
 
             # If we completely defeated them at this location
@@ -322,9 +347,7 @@ class Civilization:
                 if not other_civ.colonies:
                     universe.remove_civilization(other_civ.params.id)
                     self._add_to_history(
-                        current_date,
-                        "extinction_caused",
-                        {"civilization": other_civ.params.id},
+                        current_date, EventKind.EXTINCTION_CAUSED, other_civ.params.id
                     )
         else:
             # They win
@@ -334,12 +357,10 @@ class Civilization:
 
             self._add_to_history(
                 current_date,
-                "conflict_lost",
-                {
-                    "against_civilization": other_civ.params.id,
-                    "at_star": star.id,
-                    "lost_population": lost_population,
-                },
+                EventKind.CONFLICT_LOST,
+                other_civ.params.id,
+                star.id,
+                lost_population,
             )
 
             # If we were completely defeated at this location
@@ -350,18 +371,47 @@ class Civilization:
                 if not self.colonies:
                     universe.remove_civilization(self.params.id)
                     self._add_to_history(
-                        current_date, "extinction", {"caused_by": other_civ.params.id}
+                        current_date, EventKind.EXTINCTION, other_civ.params.id
                     )
 
-    def _add_to_history(
-        self, date: float, event_type: str, data: Dict[str, Any]
-    ) -> None:
+    def _record_visit(self, star: "Star", date: float) -> None:
+        """Mark a star as visited by this civilization"""
+        self.visited_stars[star.id] = date
+        if self._visited_count == len(self._visited_rows):
+            self._visited_rows = np.resize(self._visited_rows, 2 * self._visited_count)
+        self._visited_rows[self._visited_count] = star.row_index
+        self._visited_count += 1
+        if star.row_index >= len(self._visited_mask):
+            self._grow_visited_mask(star.row_index + 1)
+        self._visited_mask[star.row_index] = True
+        star.record_visit(self.params.id, date)
+
+    def _grow_visited_mask(self, size: int) -> None:
+        """Extend the visited mask to cover at least `size` star rows"""
+        mask = np.zeros(max(size, 2 * len(self._visited_mask)), dtype=bool)
+        mask[: len(self._visited_mask)] = self._visited_mask
+        self._visited_mask = mask
+
+    @property
+    def visited_star_ids(self) -> np.ndarray:
+        """Row indices of all visited stars (in visit order)"""
+        return self._visited_rows[: self._visited_count]
+
+    def _add_to_history(self, date: float, kind: EventKind, *values: Any) -> None:
         """Add an event to the civilization's history"""
-        self.history.append({"date": date, "event": event_type, "data": data})
+        self.history.record(date, kind, *values)
+
+    def add_colony(self, star: "Star", population: float) -> None:
+        """Establish a colony at a star (or reset the population of an existing one)"""
+        self.colonies.add(star.id, star.row_index, population)
 
     def get_total_population(self) -> float:
         """Get the total population across all colonies"""
-        return sum(self.colonies.values())
+        return self.colonies.total()
+
+    def get_largest_colony_population(self) -> float:
+        """Get the population of the largest colony (0 if none remain)"""
+        return self.colonies.largest()
 
     def __repr__(self) -> str:
         return f"Civilization(id={self.params.id}, name={self.params.name}, stars={len(self.visited_stars)}, tech={self.params.tech_level:.2f})"
@@ -0,0 +1,101 @@
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List
+import numpy as np
+
+
+class ColonyMap(MutableMapping):
+    """
+    Mapping of star ID -> colony population backed by contiguous NumPy arrays.
+
+    It behaves like the plain dict it replaces, but keeps the populations (and
+    the row index of each colony's star) packed in arrays so that totals,
+    maxima and per-colony updates can be done with vectorized NumPy operations.
+
+    New colonies must be created with `add`, since the star row is needed;
+    item assignment only updates colonies that already exist.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self._slots: Dict[str, int] = {}  # Star ID -> position in the arrays
+        self._ids: List[str] = []
+        self._pops = np.empty(capacity, dtype=np.float64)
+        self._rows = np.empty(capacity, dtype=np.int32)
+        self._n = 0
+
+    def add(self, star_id: str, row: int, population: float) -> None:
+        """Create a colony at a star, or set its population if it already exists"""
+        slot = self._slots.get(star_id)
+        if slot is not None:
+            self._pops[slot] = population
+            return
+
+        n = self._n
+        if n == len(self._pops):
+            # Grow geometrically, like list does
+            self._pops = np.resize(self._pops, 2 * n)
+            self._rows = np.resize(self._rows, 2 * n)
+        self._pops[n] = population
+        self._rows[n] = row
+        self._slots[star_id] = n
+        self._ids.append(star_id)
+        self._n = n + 1
+
+    @property
+    def populations(self) -> np.ndarray:
+        """Populations of all colonies (a view, in slot order)"""
+        return self._pops[: self._n]
+
+    @property
+    def star_rows(self) -> np.ndarray:
+        """Star row index of each colony (a view, aligned with `populations`)"""
+        return self._rows[: self._n]
+
+    def total(self) -> float:
+        """Total population across all colonies"""
+        return float(self._pops[: self._n].sum())
+
+    def largest(self) -> float:
+        """Population of the largest colony (0 if there are none)"""
+        if self._n == 0:
+            return 0.0
+        return float(self._pops[: self._n].max())
+
+    def __getitem__(self, star_id: str) -> float:
+        return float(self._pops[self._slots[star_id]])
+
+    def __setitem__(self, star_id: str, population: float) -> None:
+        slot = self._slots.get(star_id)
+        if slot is None:
+            raise KeyError(f"No colony at {star_id}; use add() to create one")
+        self._pops[slot] = population
+
+    def __delitem__(self, star_id: str) -> None:
+        slot = self._slots.pop(star_id)
+        last = self._n - 1
+        if slot != last:
+            # Move the last colony into the freed slot to keep the arrays packed
+            moved_id = self._ids[last]
+            self._ids[slot] = moved_id
+            self._slots[moved_id] = slot
+            self._pops[slot] = self._pops[last]
+            self._rows[slot] = self._rows[last]
+        self._ids.pop()
+        self._n = last
+
+    def __contains__(self, star_id: object) -> bool:
+        return star_id in self._slots
+
+    def get(self, star_id: str, default=None):
+        slot = self._slots.get(star_id)
+        if slot is None:
+            return default
+        return float(self._pops[slot])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __repr__(self) -> str:
+        return f"ColonyMap({dict(zip(self._ids, self.populations.tolist()))})"
@@ -0,0 +1,213 @@
+from enum import IntEnum
+from typing import Any, Dict, Iterator, List, Tuple, Union
+import numpy as np
+
+
+class EventKind(IntEnum):
+    """Types of events recorded in civilization and universe histories"""
+
+    # Civilization events
+    FOUNDING = 0
+    EXPANSION = 1
+    TECH_EXCHANGE = 2
+    CONFLICT_WON = 3
+    CONFLICT_LOST = 4
+    EXTINCTION_CAUSED = 5
+    EXTINCTION = 6
+    # Universe events
+    NEW_CIVILIZATION = 7
+    CIVILIZATION_EXTINCT = 8
+    STATISTICS = 9
+
+    @property
+    def event_name(self) -> str:
+        """Name used for the "event" key of materialized events"""
+        return self.name.lower()
+
+
+# Payload field names for each event kind, in the order values are recorded
+EVENT_FIELDS: Dict[EventKind, Tuple[str, ...]] = {
+    EventKind.FOUNDING: ("star", "tech_level", "population"),
+    EventKind.EXPANSION: ("from_star", "to_star", "distance", "colony_size"),
+    EventKind.TECH_EXCHANGE: ("with_civilization", "at_star", "tech_boost"),
+    EventKind.CONFLICT_WON: (
+        "against_civilization",
+        "at_star",
+        "captured_population",
+    ),
+    EventKind.CONFLICT_LOST: ("against_civilization", "at_star", "lost_population"),
+    EventKind.EXTINCTION_CAUSED: ("civilization",),
+    EventKind.EXTINCTION: ("caused_by",),
+    EventKind.NEW_CIVILIZATION: ("id", "name", "origin_star"),
+    EventKind.CIVILIZATION_EXTINCT: ("id", "name", "existed_for"),
+    EventKind.STATISTICS: ("civilizations", "total_population", "inhabited_stars"),
+}
+
+# Formatters for the short description of an event, called with the event
+# payload (fields as in EVENT_FIELDS); other kinds have no description
+_EVENT_DETAILS = {
+    EventKind.EXPANSION: lambda from_star, to_star, *_: (
+        f"expanded from star_{from_star[-1:]} to star_{to_star[-1:]}"
+    ),
+    EventKind.TECH_EXCHANGE: lambda with_civ, at_star, boost: (
+        f"gained {boost:.3f} tech from {with_civ}"
+    ),
+    EventKind.CONFLICT_WON: lambda against, at_star, _: (
+        f"conflict_won against {against} at star_{at_star[-1:]}"
+    ),
+    EventKind.CONFLICT_LOST: lambda against, at_star, _: (
+        f"conflict_lost against {against} at star_{at_star[-1:]}"
+    ),
+}
+
+
+def format_event_details(kind: EventKind, payload: Tuple[Any, ...]) -> str:
+    """Short description of an event, as shown in reports and summaries"""
+    format_details = _EVENT_DETAILS.get(kind)
+    return format_details(*payload) if format_details else ""
+
+
+_KINDS = tuple(EventKind)
+_EVENT_NAMES = tuple(kind.event_name for kind in _KINDS)
+
+
+class HistoryBuffer:
+    """
+    Append-only event log stored column-wise.
+
+    Dates and event kinds live in preallocated NumPy arrays (doubled when
+    full), and each event's payload is a compact tuple ordered as in
+    EVENT_FIELDS instead of a pair of dicts. Recording an event is two index
+    assignments and a list append.
+
+    Reading behaves like the list of {"date", "event", "data"} dicts it
+    replaces: indexing, slicing, iteration and len() all work, with event
+    dicts built on demand. The `dates` and `kinds` arrays allow fast
+    filtering without building any dicts.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._dates = np.empty(capacity, dtype=np.float64)
+        self._kinds = np.empty(capacity, dtype=np.int8)
+        self._payloads: List[Tuple[Any, ...]] = []
+        self._n = 0
+
+    def record(self, date: float, kind: EventKind, *values: Any) -> None:
+        """Append an event; `values` follow the field order in EVENT_FIELDS"""
+        n = self._n
+        if n == len(self._dates):
+            self._dates = np.resize(self._dates, 2 * n)
+            self._kinds = np.resize(self._kinds, 2 * n)
+        self._dates[n] = date
+        self._kinds[n] = kind
+        self._payloads.append(values)
+        self._n = n + 1
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Date of every event (a view, in recording order)"""
+        return self._dates[: self._n]
+
+    @property
+    def kinds(self) -> np.ndarray:
+        """EventKind value of every event (a view, in recording order)"""
+        return self._kinds[: self._n]
+
+    def indices_of(self, kind: EventKind) -> np.ndarray:
+        """Positions of all events of the given kind"""
+        return np.flatnonzero(self.kinds == kind)
+
+    def recent(self, n: int) -> List[Tuple[float, EventKind, Tuple[Any, ...]]]:
+        """Last `n` events as raw (date, kind, payload) tuples, oldest first"""
+        start = max(self._n - n, 0)
+        return [
+            (float(self._dates[i]), _KINDS[self._kinds[i]], self._payloads[i])
+            for i in range(start, self._n)
+        ]
+
+    def _event(self, i: int) -> Dict[str, Any]:
+        kind = _KINDS[self._kinds[i]]
+        return {
+            "date": float(self._dates[i]),
+            "event": _EVENT_NAMES[kind],
+            "data": dict(zip(EVENT_FIELDS[kind], self._payloads[i])),
+        }
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(index, slice):
+            return [self._event(i) for i in range(*index.indices(self._n))]
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("history index out of range")
+        return self._event(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._n):
+            yield self._event(i)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __repr__(self) -> str:
+        return f"HistoryBuffer(events={self._n})"
+
+
+class TimeSeriesBuffer:
+    """
+    Append-only (date, value) series stored in one preallocated NumPy array.
+
+    Appending is a single indexed store; the array doubles when full. It reads
+    like the list of (date, value) tuples it replaces, and `dates`, `values`
+    and `array` expose the data without any per-entry conversion.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._data = np.empty((capacity, 2), dtype=np.float64)
+        self._n = 0
+
+    def append(self, date: float, value: float) -> None:
+        """Add a sample at the end of the series"""
+        n = self._n
+        if n == len(self._data):
+            self._data = np.resize(self._data, (2 * n, 2))
+        self._data[n] = date, value
+        self._n = n + 1
+
+    @property
+    def array(self) -> np.ndarray:
+        """All samples as an (n, 2) array of (date, value) rows (a view)"""
+        return self._data[: self._n]
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Sample dates (a view)"""
+        return self._data[: self._n, 0]
+
+    @property
+    def values(self) -> np.ndarray:
+        """Sample values (a view)"""
+        return self._data[: self._n, 1]
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[float, float], List[Tuple[float, float]]]:
+        if isinstance(index, slice):
+            return [tuple(row) for row in self._data[: self._n][index].tolist()]
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("time series index out of range")
+        return tuple(self._data[index].tolist())
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        for row in self._data[: self._n].tolist():
+            yield tuple(row)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __repr__(self) -> str:
+        return f"TimeSeriesBuffer(samples={self._n})"
@@ -1,3 +1,4 @@
+from math import sqrt
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 
@@ -9,10 +10,12 @@ class Star:
     Attributes:
         id: Unique identifier for the star
         name: Human-readable name
-        position: 3D coordinates in space
+        position: 3D coordinates in space (a row view of the universe's
+            position array for stars created by Universe.initialize_stars)
         resources: Resource level (0-1 scale of habitability/resources)
         planets: Number of planets in the system
         visiting_civilizations: Map of civilization IDs to first visit date
+        row_index: Index of this star in the universe's per-star arrays
     """
 
     def __init__(
@@ -22,17 +25,25 @@ class Star:
         position: np.ndarray,  # 3D vector
         resources: float,
         planets: int,
+        row_index: int = -1,
     ):
         self.id = id
         self.name = name
         self.position = position
         self.resources = resources  # 0-1 scale
         self.planets = planets
+        self.row_index = row_index  # -1 until placed in a universe
         self.visiting_civilizations: Dict[str, float] = {}
 
     def distance_to(self, other: "Star") -> float:
         """Calculate the distance to another star"""
-        return np.linalg.norm(self.position - other.position)
+        # Plain scalar math is much cheaper than NumPy dispatch for 3 elements
+        px, py, pz = self.position.tolist()
+        qx, qy, qz = other.position.tolist()
+        dx = px - qx
+        dy = py - qy
+        dz = pz - qz
+        return sqrt(dx * dx + dy * dy + dz * dz)
 
     def record_visit(self, civ_id: str, date: float) -> None:
         """Record a visit by a civilization if not already recorded"""
@@ -40,8 +51,8 @@ class Star:
             self.visiting_civilizations[civ_id] = date
 
     def get_visiting_civilizations(self) -> Dict[str, float]:
-        """Get all civilizations present at this star"""
-        return self.visiting_civilizations.copy()
+        """Get all civilizations present at this star (the live dict; do not modify)"""
+        return self.visiting_civilizations
 
     def __repr__(self) -> str:
         return f"Star(id={self.id}, name={self.name}, resources={self.resources:.2f}, planets={self.planets})"
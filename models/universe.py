@@ -1,8 +1,9 @@
-from typing import Dict, List, Tuple, Optional, Set, Any
+from typing import Dict, List, Tuple, Optional, Set, Any, Union
 import numpy as np
-import random
+from scipy.spatial import cKDTree
 from .star import Star
 from .civilization import Civilization
+from .history import EventKind, HistoryBuffer, TimeSeriesBuffer
 
 
 class Universe:
@@ -13,18 +14,53 @@ class Universe:
     their interactions over time.
     """
 
-    def __init__(self, size: float = 1000.0):
+    def __init__(
+        self,
+        size: float = 1000.0,
+        seed: Optional[Union[int, np.random.SeedSequence]] = None,
+    ):
         """
         Initialize a new universe.
 
         Args:
             size: The size of the cubic space (in arbitrary units)
+            seed: Seed for the universe's random generator (random if None)
         """
         self.stars: Dict[str, Star] = {}
         self.civilizations: Dict[str, Civilization] = {}
         self.current_date: float = 0
         self.size = size
-        self.history: List[Dict[str, Any]] = []
+        self.history = HistoryBuffer()
+        # Logged statistics as ready-made series (also recorded in `history`)
+        self.civilization_count_history = TimeSeriesBuffer()
+        self.population_history = TimeSeriesBuffer()
+        self.inhabited_stars_history = TimeSeriesBuffer()
+        # Single random generator for star generation and expansion draws
+        self._rng = np.random.default_rng(seed)
+        # Civilizations that went extinct during the current update. They stay
+        # in `civilizations` (so it can be iterated without a copy) until the
+        # end of the tick, but are no longer returned by get_civilization.
+        self._updating = False
+        self._pending_extinct: List[str] = []
+        # Scratch mask (indexed by star row) reused when counting inhabited stars
+        self._inhabited = np.zeros(0, dtype=bool)
+        # Star positions as one contiguous (N, 3) array; each Star.position is a
+        # row view into it. Also backs the spatial index built once stars exist,
+        # and is handed to the plots as is (star_positions()). It stays float64:
+        # distances from it drive expansion, and matplotlib projects in float64.
+        self._positions = np.zeros((0, 3))
+        # Per-star resources and planet counts, indexed by star row
+        self._resources = np.zeros(0)
+        self._planets = np.zeros(0, dtype=np.int64)
+        self._star_ids: List[str] = []
+        self._kdtree: Optional[cKDTree] = None
+        # Number of civilizations that have visited each star, indexed by star
+        # row. Lets civilizations skip stars nobody else has reached.
+        self._visitor_counts = np.zeros(0, dtype=np.int32)
+        # Distance from each star to its nearest neighbour, and the smallest of
+        # those. A range below either means no expansion target is reachable.
+        self._nearest_distances = np.zeros(0)
+        self._min_star_distance = np.inf
 
     def initialize_stars(self, count: int) -> None:
         """
@@ -33,33 +69,54 @@ class Universe:
         Args:
             count: Number of stars to generate
         """
-        for i in range(count):
-            # Random position in a cubic space
-            position = np.random.uniform(-self.size / 2, self.size / 2, 3)
+        half_size = self.size / 2
+
+        # Random positions in a cubic space, generated in one call
+        self._positions = self._rng.uniform(-half_size, half_size, (count, 3))
 
-            # Random resources (higher near center, lower at edges)
-            distance_from_center = np.linalg.norm(position)
-            resource_base = np.random.uniform(0, 1)
-            # Stars closer to center tend to have more resources
-            resource_modifier = 1 - (distance_from_center / (self.size / 2)) * 0.5
-            resources = min(1.0, resource_base * resource_modifier)
+        # Random resources (higher near center, lower at edges)
+        distance_from_center = np.linalg.norm(self._positions, axis=1)
+        resource_base = self._rng.uniform(0, 1, count)
+        # Stars closer to center tend to have more resources
+        resource_modifier = 1 - (distance_from_center / half_size) * 0.5
+        self._resources = np.minimum(1.0, resource_base * resource_modifier)
 
-            # Random number of planets
-            planets = np.random.geometric(p=0.2)  # Geometric distribution
-            planets = min(planets, 10)  # Cap at 10 planets
+        # Random number of planets (geometric distribution, capped at 10)
+        self._planets = np.minimum(self._rng.geometric(p=0.2, size=count), 10)
 
-            # Create the star
+        # Create the star objects on top of the per-star arrays
+        resources = self._resources.tolist()
+        planets = self._planets.tolist()
+        for i in range(count):
             star = Star(
                 id=f"star_{i}",
                 name=f"Star-{i}",
-                position=position,
-                resources=resources,
-                planets=planets,
+                position=self._positions[i],  # View into the shared array
+                resources=resources[i],
+                planets=planets[i],
+                row_index=i,
             )
 
             # Add to our collection
             self.stars[star.id] = star
 
+        self._inhabited = np.zeros(count, dtype=bool)
+        self._visitor_counts = np.zeros(count, dtype=np.int32)
+
+        # Build the spatial index used for range queries
+        self._star_ids = list(self.stars.keys())
+        self._kdtree = cKDTree(
+            self._positions, leafsize=16, balanced_tree=True, compact_nodes=True
+        )
+        if count > 1:
+            # k=2 because each star's closest hit is itself
+            distances, _ = self._kdtree.query(self._positions, k=2)
+            self._nearest_distances = distances[:, 1]
+            self._min_star_distance = float(self._nearest_distances.min())
+        else:
+            self._nearest_distances = np.full(count, np.inf)
+            self._min_star_distance = np.inf
+
     def add_civilization(self, civ: Civilization) -> None:
         """
         Add a new civilization to the universe.
@@ -68,16 +125,16 @@ class Universe:
             civ: The civilization to add
         """
         self.civilizations[civ.params.id] = civ
+        # Count the visits made before joining (the origin star)
+        self._visitor_counts[civ.visited_star_ids] += 1
 
         # Log the new civilization
         self._add_to_history(
             self.current_date,
-            "new_civilization",
-            {
-                "id": civ.params.id,
-                "name": civ.params.name,
-                "origin_star": civ.params.origin_star.id,
-            },
+            EventKind.NEW_CIVILIZATION,
+            civ.params.id,
+            civ.params.name,
+            civ.params.origin_star.id,
         )
 
     def remove_civilization(self, civ_id: str) -> None:
@@ -87,46 +144,111 @@ class Universe:
         Args:
             civ_id: ID of the civilization to remove
         """
-        if civ_id in self.civilizations:
+        if civ_id in self.civilizations and civ_id not in self._pending_extinct:
             civ = self.civilizations[civ_id]
-            del self.civilizations[civ_id]
+            if self._updating:
+                # Don't resize the dict while update() is iterating over it
+                self._pending_extinct.append(civ_id)
+            else:
+                del self.civilizations[civ_id]
 
             # Log the extinction
             self._add_to_history(
                 self.current_date,
-                "civilization_extinct",
-                {
-                    "id": civ_id,
-                    "name": civ.params.name,
-                    "existed_for": self.current_date - civ.params.founding_date,
-                },
+                EventKind.CIVILIZATION_EXTINCT,
+                civ_id,
+                civ.params.name,
+                self.current_date - civ.params.founding_date,
             )
 
+    def random(self, n: int) -> np.ndarray:
+        """Draw `n` uniform samples in [0, 1) from the universe's generator"""
+        return self._rng.random(n)
+
     def get_star(self, star_id: str) -> Optional[Star]:
         """Get a star by ID"""
         return self.stars.get(star_id)
 
     def get_civilization(self, civ_id: str) -> Optional[Civilization]:
         """Get a civilization by ID"""
-        return self.civilizations.get(civ_id)
-
-    def get_nearby_stars(self, position: np.ndarray, range_limit: float) -> List[Star]:
+        civ = self.civilizations.get(civ_id)
+        if (
+            civ is not None
+            and self._pending_extinct
+            and civ_id in self._pending_extinct
+        ):
+            return None
+        return civ
+
+    def get_nearby_stars(
+        self,
+        position: np.ndarray,
+        range_limit: float,
+        exclude_id: Optional[str] = None,
+    ) -> List[Star]:
         """
         Get stars within a certain range of a given position.
 
         Args:
             position: 3D position to search from
             range_limit: Maximum distance to include
+            exclude_id: ID of a star to leave out (usually the star at `position`);
+                if omitted, any star exactly at `position` is left out
 
         Returns:
             List of stars within the specified range
         """
-        nearby = []
-        for star in self.stars.values():
-            distance = np.linalg.norm(star.position - position)
-            if distance <= range_limit and distance > 0:  # Exclude self
-                nearby.append(star)
-        return nearby
+        if self._kdtree is None:
+            return []
+
+        idxs = self._kdtree.query_ball_point(position, range_limit, return_sorted=True)
+        star_ids = self._star_ids
+        if exclude_id is None:
+            # Exclude self by position, matching a zero distance
+            idxs = np.asarray(idxs, dtype=np.intp)
+            keep = np.any(self._positions[idxs] != position, axis=1)
+            return [self.stars[star_ids[i]] for i in idxs[keep]]
+
+        return [self.stars[star_ids[i]] for i in idxs if star_ids[i] != exclude_id]
+
+    def get_star_by_row(self, row: int) -> Star:
+        """Get a star by its row index in the per-star arrays"""
+        return self.stars[self._star_ids[row]]
+
+    def star_positions(self) -> np.ndarray:
+        """Positions of all stars as one (N, 3) array, in `stars` order (do not modify)"""
+        return self._positions
+
+    def star_resources(self) -> np.ndarray:
+        """Resources of all stars as one array, in `stars` order (do not modify)"""
+        return self._resources
+
+    def query_range(
+        self, position: np.ndarray, range_limit: float, exclude_row: int = -1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the rows of all stars within range of a position, with their distances.
+
+        Args:
+            position: 3D position to search from
+            range_limit: Maximum distance to include
+            exclude_row: Row of a star to leave out (usually the star at `position`)
+
+        Returns:
+            (rows, distances) arrays, ordered by row
+        """
+        if self._kdtree is None:
+            return np.zeros(0, dtype=np.intp), np.zeros(0)
+
+        rows = np.asarray(
+            self._kdtree.query_ball_point(position, range_limit, return_sorted=True),
+            dtype=np.intp,
+        )
+        if exclude_row >= 0:
+            rows = rows[rows != exclude_row]
+        # One vectorized distance computation for all hits
+        distances = np.linalg.norm(self._positions[rows] - position, axis=1)
+        return rows, distances
 
     def run_simulation(self, steps: int, callback=None) -> None:
         """
@@ -136,18 +258,32 @@ class Universe:
             steps: Number of time steps to simulate
             callback: Optional callback function called after each step
         """
+        # Bind the bound method once so the loop avoids a lookup per step
+        update = self.update
+        if callback is None:
+            for _ in range(steps):
+                update()
+            return
+
         for _ in range(steps):
-            self.update()
-            if callback:
-                callback(self)
+            update()
+            callback(self)
 
     def update(self) -> None:
         """Update the universe for one time step"""
         self.current_date += 1
 
-        # Update all civilizations
-        for civ in list(self.civilizations.values()):
-            civ.update(self.current_date, self)
+        # Update all civilizations. Extinctions during the loop are deferred,
+        # so the dict can be iterated directly instead of copied.
+        self._updating = True
+        try:
+            for civ in self.civilizations.values():
+                civ.update(self.current_date, self)
+        finally:
+            self._updating = False
+            for civ_id in self._pending_extinct:
+                del self.civilizations[civ_id]
+            self._pending_extinct.clear()
 
         # Process interactions between civilizations at same stars
         self._process_interactions()
@@ -168,26 +304,30 @@ class Universe:
             civ.get_total_population() for civ in self.civilizations.values()
         )
 
-        # Count stars with civilizations
-        inhabited_stars = set()
-        for civ in self.civilizations.values():
-            inhabited_stars.update(civ.visited_stars.keys())
+        inhabited_stars = self.count_inhabited_stars()
 
         self._add_to_history(
             self.current_date,
-            "statistics",
-            {
-                "civilizations": num_civs,
-                "total_population": total_population,
-                "inhabited_stars": len(inhabited_stars),
-            },
+            EventKind.STATISTICS,
+            num_civs,
+            total_population,
+            inhabited_stars,
         )
+        self.civilization_count_history.append(self.current_date, num_civs)
+        self.population_history.append(self.current_date, total_population)
+        self.inhabited_stars_history.append(self.current_date, inhabited_stars)
+
+    def count_inhabited_stars(self) -> int:
+        """Count the stars visited by at least one civilization"""
+        inhabited = self._inhabited
+        inhabited[:] = False
+        for civ in self.civilizations.values():
+            inhabited[civ.visited_star_ids] = True
+        return int(np.count_nonzero(inhabited))
 
-    def _add_to_history(
-        self, date: float, event_type: str, data: Dict[str, Any]
-    ) -> None:
+    def _add_to_history(self, date: float, kind: EventKind, *values: Any) -> None:
         """Add an event to the universe history"""
-        self.history.append({"date": date, "event": event_type, "data": data})
+        self.history.record(date, kind, *values)
 
     def get_all_civilizations(self) -> List[Civilization]:
         """Get a list of all civilizations"""
@@ -6,37 +6,35 @@ This script runs a simulation and saves detailed reports to files
 for easy sharing with others.
 """
 
+import argparse
+import os
+import sys
 import numpy as np
+import matplotlib
+
+# Without a display nothing can be shown, so use the non-interactive backend:
+# no GUI toolkit gets started and figures can be released once saved
+if sys.platform.startswith("linux") and not (
+    os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+):
+    matplotlib.use("Agg")
 import matplotlib.pyplot as plt
-from models import Universe, Civilization, CivilizationParams
+from models import Universe, Civilization, CivilizationParams, format_event_details
 from simulation import UniverseVisualizer
 from tabulate import tabulate
-import os
+import heapq
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from string import Template
 
+# Flags for the text report files, written through raw file descriptors
+_TXT_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+# The reused text encoding buffer is dropped once a write grows it beyond this
+_TXT_BUF_CAP = 128 * 1024
 
-class SimulationReporter:
-    """Class to handle reporting and exporting simulation data"""
-
-    def __init__(self, output_dir="simulation_reports"):
-        """Initialize the reporter with an output directory"""
-        # Create output directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-
-        # Set up file paths
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.output_dir = output_dir
-        self.base_filename = f"{output_dir}/sim_report_{timestamp}"
-        self.html_file = f"{self.base_filename}.html"
-        self.txt_file = f"{self.base_filename}.txt"
-        self.summary_file = f"{self.base_filename}_summary.txt"
-
-        # Initialize HTML file with header
-        with open(self.html_file, "w") as f:
-            f.write(
-                """<!DOCTYPE html>
+# Static HTML report header, split around the generation timestamp
+_HTML_HEADER_PREFIX = """<!DOCTYPE html>
 <html>
 <head>
     <title>Interstellar Civilization Simulation Report</title>
@@ -56,8 +54,7 @@ class SimulationReporter:
 <body>
     <h1>Interstellar Civilization Simulation Report</h1>
     <p>Generated on: """
-                + datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                + """</p>
+_HTML_HEADER_SUFFIX = """</p>
     <div class="summary">
         <h2>Simulation Parameters</h2>
         <ul>
@@ -68,53 +65,487 @@ class SimulationReporter:
         </ul>
     </div>
 """
+
+# Closing tags of the HTML report, written when the report is closed
+_HTML_FOOTER = """</body>
+</html>
+"""
+
+# Column headers of the per-step civilization table
+_TABLE_HEADERS = [
+    "Civilization",
+    "Stars",
+    "Population",
+    "Tech Level",
+    "Type",
+    "Motivation",
+]
+# Header cells of the HTML table (the same for every step)
+_TABLE_HEADER_HTML = "".join(
+    f"                <th>{header}</th>\n" for header in _TABLE_HEADERS
+)
+
+# HTML block for one report step, filled in with a single substitution
+_STEP_TPL = Template(
+    """
+    <div class="step">
+        <h2>Step $step (Date: $date)</h2>
+        <p>$summary</p>
+        
+        <h3>Civilization Status</h3>
+        <table>
+            <tr>
+"""
+    + _TABLE_HEADER_HTML
+    + """            </tr>
+$rows_html        </table>
+        
+        <h3>Recent Events</h3>
+        <div class="events">
+$events_html        </div>
+    </div>
+"""
+)
+
+
+def _can_show_figures():
+    """Whether the active matplotlib backend can display figures"""
+    return matplotlib.get_backend().lower() != "agg"
+
+
+def _write_text(fd, parts, buf):
+    """Encode text fragments into `buf` and write it all to `fd` with os.write"""
+    buf.clear()
+    for part in parts:
+        buf += part.encode()
+
+    data = memoryview(buf)
+    try:
+        # os.write may write less than asked for, so loop until done
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        data.release()
+
+
+class ReportSink:
+    """
+    One output of a SimulationReporter.
+
+    The reporter gathers the data once and passes it to each sink, so outputs
+    that aren't wanted cost nothing. Hooks do nothing by default.
+    """
+
+    label = "Report"
+    suffix = ""
+    # Whether this sink uses per-step data (the reporter skips collecting it
+    # when no sink does)
+    wants_steps = False
+    # Whether this sink saves the figures (save_visualizations skips drawing
+    # them when no sink does)
+    saves_figures = False
+
+    def open(self, base_filename, generated_on):
+        """Start the output next to `base_filename`, stamped with `generated_on`"""
+        self.path = f"{base_filename}{self.suffix}"
+        self.generated_on = generated_on
+
+    def on_step(self, step):
+        """Handle the data recorded for one simulation step"""
+
+    def on_final(self, summary):
+        """Handle the final summary lines"""
+
+    def save_figures(self, figures):
+        """
+        Save (name, title, figure) triples; return the saved images as
+        (title, path relative to the report directory) pairs
+        """
+        return []
+
+    def on_visualizations(self, images):
+        """Handle the (title, relative path) images that were saved"""
+
+    def flush(self):
+        """Write any buffered output to disk"""
+
+    def close(self):
+        """Flush and close the output"""
+
+
+class HtmlSink(ReportSink):
+    """HTML report with a table and recent events per step"""
+
+    label = "HTML Report"
+    suffix = ".html"
+    wants_steps = True
+
+    def open(self, base_filename, generated_on):
+        super().open(base_filename, generated_on)
+        # The file stays open for the whole run (see close())
+        self._fh = open(self.path, "w", buffering=1 << 20)
+        self._fh.writelines(
+            (
+                _HTML_HEADER_PREFIX,
+                generated_on,
+                _HTML_HEADER_SUFFIX,
             )
+        )
+        # Per-step data, rendered in one streamed pass by on_final
+        self._steps = []
+
+    def on_step(self, step):
+        self._steps.append(step)
+
+    def _render_step(self, step):
+        """Render the HTML block for one recorded step"""
+        rows_html = "".join(
+            "            <tr>\n"
+            + "".join(f"                <td>{cell}</td>\n" for cell in row)
+            + "            </tr>\n"
+            for row in step["rows"]
+        )
+        events_html = "".join(
+            f'            <div class="event">[{event["date"]:.0f}] {event["civ_name"]}: {event["event_type"]} - {event["details"]}</div>\n'
+            for event in step["events"]
+        )
+        return _STEP_TPL.substitute(
+            step=step["step"],
+            date=step["date"],
+            summary=step["universe_summary"],
+            rows_html=rows_html,
+            events_html=events_html,
+        )
+
+    def on_final(self, summary):
+        # Stream out every recorded step, one block at a time, then the final
+        # results
+        f = self._fh
+        f.writelines(self._render_step(step) for step in self._steps)
+        self._steps.clear()
+        # Build the whole results block, then hand it over in one writelines
+        parts = [
+            """
+    <div class="summary">
+        <h2>Final Results</h2>
+"""
+        ]
+        for line in summary:
+            if line.endswith(":"):
+                parts.append(f"        <h3>{line[:-1]}</h3>\n")
+            elif line == "":
+                parts.append("        <br>\n")
+            else:
+                parts.append(f"        <p>{line}</p>\n")
+        parts.append("    </div>\n")
+        f.writelines(parts)
+
+    def on_visualizations(self, images):
+        if not images:
+            return
+        # Add links to the saved images
+        self._fh.writelines(
+            (
+                """
+    <div class="visualizations">
+        <h2>Visualizations</h2>
+        <p>These visualizations show the simulation results:</p>
+        <ul>
+""",
+                *(
+                    f'            <li><a href="{path}">{title}</a></li>\n'
+                    for title, path in images
+                ),
+                """        </ul>
+    </div>
+""",
+            )
+        )
+
+    def flush(self):
+        self._fh.flush()
+
+    def close(self):
+        # The document is closed only here, so sections added after the final
+        # summary (like the visualization links) still end up inside <body>
+        # without having to patch what was already written
+        try:
+            self._fh.write(_HTML_FOOTER)
+        finally:
+            self._fh.close()
+
+
+class TextSink(ReportSink):
+    """Plain-text report, written once the final summary is added"""
+
+    label = "Text Report"
+    suffix = ".txt"
+    wants_steps = True
+
+    def open(self, base_filename, generated_on):
+        super().open(base_filename, generated_on)
+        # Text output is encoded into one reused bytearray and written with a
+        # single os.write (the header now, everything else at the end)
+        self._fd = os.open(self.path, _TXT_OPEN_FLAGS, 0o644)
+        self._buf = bytearray()
+        # Per-step data, rendered in one pass by on_final
+        self._steps = []
+        try:
+            self._write(
+                [
+                    f"INTERSTELLAR CIVILIZATION SIMULATION REPORT\n",
+                    f"Generated on: {generated_on}\n\n",
+                    f"SIMULATION PARAMETERS\n",
+                    f"Universe Size: 500.0\n",
+                    f"Stars: 300\n",
+                    f"Simulation Steps: 200\n",
+                    f"Civilizations: 3 (Explorers, Scholars, Conquerors)\n\n",
+                ]
+            )
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def _write(self, parts):
+        _write_text(self._fd, parts, self._buf)
+        # Don't hold on to an unusually large buffer
+        if len(self._buf) > _TXT_BUF_CAP:
+            self._buf = bytearray()
+
+    def on_step(self, step):
+        # Only the data is kept here; all steps are written by on_final, so
+        # no file I/O happens while the simulation runs
+        self._steps.append(step)
+
+    def _render_step(self, step, parts):
+        """Append the text fragments for one recorded step to `parts`"""
+        parts += [
+            f"\n{'='*50}\n",
+            f"STEP {step['step']} (Date: {step['date']})\n",
+            f"{'='*50}\n\n",
+            f"{step['universe_summary']}\n\n",
+            "CIVILIZATION STATUS:\n",
+            tabulate(step["rows"], _TABLE_HEADERS, tablefmt="grid"),
+            "\n\nRECENT EVENTS:\n",
+        ]
+        for event in step["events"]:
+            parts.append(
+                f'[{event["date"]:.0f}] {event["civ_name"]}: {event["event_type"]} - {event["details"]}\n'
+            )
+        parts.append("\n")
+
+    def on_final(self, summary):
+        # Every step and the final results go out in a single write
+        parts = []
+        for step in self._steps:
+            self._render_step(step, parts)
+        self._steps.clear()
+        parts += [
+            "\n" + "=" * 50 + "\n",
+            "FINAL RESULTS\n",
+            "=" * 50 + "\n\n",
+            "\n".join(summary),
+        ]
+        self._write(parts)
+
+    def close(self):
+        # Output is unbuffered (written with os.write), so just close
+        os.close(self._fd)
+
+
+class SummarySink(ReportSink):
+    """Standalone file with only the final summary"""
+
+    label = "Summary"
+    suffix = "_summary.txt"
+
+    def on_final(self, summary):
+        fd = os.open(self.path, _TXT_OPEN_FLAGS, 0o644)
+        try:
+            _write_text(
+                fd,
+                [
+                    "INTERSTELLAR CIVILIZATION SIMULATION - SUMMARY\n",
+                    f"Generated on: {self.generated_on}\n\n",
+                    "\n".join(summary),
+                ],
+                bytearray(),
+            )
+        finally:
+            os.close(fd)
+
+
+class PngSink(ReportSink):
+    """PNG images of the final state, in a visualizations/ directory"""
+
+    label = "Visualizations"
+    suffix = "visualizations"
+    saves_figures = True
+
+    def __init__(self, dpi=150, final_dpi=300):
+        """
+        Args:
+            dpi: Resolution of the images linked from the HTML report
+            final_dpi: Resolution of an extra print-quality copy of the 3D
+                universe state (None to skip it)
+        """
+        self.dpi = dpi
+        self.final_dpi = final_dpi
+
+    def open(self, base_filename, generated_on):
+        super().open(base_filename, generated_on)
+        # Images go in a directory next to the reports, not a sibling file
+        self.path = f"{os.path.dirname(base_filename)}/{self.suffix}"
+
+    def save_figures(self, figures):
+        vis_dir = self.path
+        if not os.path.exists(vis_dir):
+            os.makedirs(vis_dir)
 
-        # Initialize text file with header
-        with open(self.txt_file, "w") as f:
-            f.write(f"INTERSTELLAR CIVILIZATION SIMULATION REPORT\n")
-            f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"SIMULATION PARAMETERS\n")
-            f.write(f"Universe Size: 500.0\n")
-            f.write(f"Stars: 300\n")
-            f.write(f"Simulation Steps: 200\n")
-            f.write(f"Civilizations: 3 (Explorers, Scholars, Conquerors)\n\n")
+        # Save them concurrently: PNG compression releases the GIL, so the
+        # saves overlap. A low zlib level trades file size for encoding speed.
+        # Each figure is submitted once, since savefig changes the figure's dpi
+        # while it runs.
+        with ThreadPoolExecutor(max_workers=len(figures)) as executor:
+            futures = [
+                executor.submit(
+                    fig.savefig,
+                    f"{vis_dir}/{name}.png",
+                    dpi=self.dpi,
+                    pil_kwargs={"compress_level": 1},
+                )
+                for name, _, fig in figures
+            ]
+            for future in futures:
+                future.result()
+
+        if self.final_dpi is not None:
+            # Screen resolution is plenty for the report; keep one
+            # print-quality image of the final state
+            name, _, fig = figures[0]
+            fig.savefig(
+                f"{vis_dir}/{name}_print.png",
+                dpi=self.final_dpi,
+                pil_kwargs={"compress_level": 1},
+            )
+
+        print(f"Visualizations saved to {vis_dir}/")
+        return [(title, f"{self.suffix}/{name}.png") for name, title, _ in figures]
+
+
+# Report outputs by the names used on the command line
+_SINKS = {
+    "html": HtmlSink,
+    "text": TextSink,
+    "summary": SummarySink,
+    "png": PngSink,
+}
+
+
+class SimulationReporter:
+    """Class to handle reporting and exporting simulation data"""
+
+    def __init__(self, output_dir="simulation_reports", sinks=None):
+        """
+        Initialize the reporter with an output directory.
+
+        Args:
+            output_dir: Directory for the report files
+            sinks: Report outputs to write (HTML, text, summary and PNG images
+                by default)
+        """
+        # Create output directory if it doesn't exist
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+        # Set up file paths
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        # Every report is stamped with the same time, formatted once
+        self._now_str = now.strftime("%Y-%m-%d %H:%M:%S")
+        self.output_dir = output_dir
+        self.base_filename = f"{output_dir}/sim_report_{timestamp}"
+
+        # Open every output; files stay open for the whole run (see close())
+        if sinks is None:
+            sinks = (HtmlSink(), TextSink(), SummarySink(), PngSink())
+        self.sinks = list(sinks)
+        self._closed = False
+        for i, sink in enumerate(self.sinks):
+            try:
+                sink.open(self.base_filename, self._now_str)
+            except BaseException:
+                # Don't leave the outputs opened so far behind
+                self._close_sinks(self.sinks[:i])
+                raise
+        self._step_sinks = [sink for sink in self.sinks if sink.wants_steps]
+
+        # Civilization ID -> (name, "bio/org" type, motivation), see add_step_report
+        self._civ_static = {}
 
         print(f"Simulation reports will be saved to:")
-        print(f"- HTML Report: {self.html_file}")
-        print(f"- Text Report: {self.txt_file}")
-        print(f"- Summary: {self.summary_file}")
+        for label, path in self.report_paths.items():
+            print(f"- {label}: {path}")
+
+    @property
+    def report_paths(self):
+        """Output path of each attached sink, keyed by the sink's label"""
+        return {sink.label: sink.path for sink in self.sinks}
+
+    def _sink_path(self, sink_type):
+        for sink in self.sinks:
+            if isinstance(sink, sink_type):
+                return sink.path
+        return None
+
+    @property
+    def html_file(self):
+        """Path of the HTML report (None without an HtmlSink)"""
+        return self._sink_path(HtmlSink)
+
+    @property
+    def txt_file(self):
+        """Path of the text report (None without a TextSink)"""
+        return self._sink_path(TextSink)
+
+    @property
+    def summary_file(self):
+        """Path of the summary file (None without a SummarySink)"""
+        return self._sink_path(SummarySink)
 
     def add_step_report(self, universe, step):
         """Add a report for the current simulation step"""
+        # Nothing to collect if no output reports individual steps
+        if not self._step_sinks:
+            return
+
         # Prepare data
-        headers = [
-            "Civilization",
-            "Stars",
-            "Population",
-            "Tech Level",
-            "Type",
-            "Motivation",
-        ]
         rows = []
 
-        # Universe stats
+        # Universe stats (inhabited stars are counted with the universe's
+        # per-star bitmask rather than a union of visited-star sets)
         total_stars = len(universe.stars)
-        inhabited_stars = set()
-        for civ in universe.civilizations.values():
-            inhabited_stars.update(civ.visited_stars.keys())
+        num_inhabited = universe.count_inhabited_stars()
 
-        universe_summary = f"Universe: {len(inhabited_stars)}/{total_stars} stars inhabited ({len(inhabited_stars)/total_stars*100:.1f}%)"
+        universe_summary = f"Universe: {num_inhabited}/{total_stars} stars inhabited ({num_inhabited/total_stars*100:.1f}%)"
 
         # Civilization stats
+        civ_static = self._civ_static
         for civ_id, civ in universe.civilizations.items():
-            name = civ.params.name
+            # Name, types and motivation never change, so they are formatted
+            # only the first time a civilization is seen
+            static = civ_static.get(civ_id)
+            if static is None:
+                params = civ.params
+                static = civ_static[civ_id] = (
+                    params.name,
+                    f"{params.biological_type}/{params.organization_type}",
+                    params.motivation,
+                )
+            name, bio_org, motivation = static
             num_stars = len(civ.visited_stars)
             population = civ.get_total_population()
             tech_level = civ.params.tech_level
-            bio_type = civ.params.biological_type
-            org_type = civ.params.organization_type
-            motivation = civ.params.motivation
 
             rows.append(
                 [
@@ -122,7 +553,7 @@ class SimulationReporter:
                     num_stars,
                     f"{population:.1e}",
                     f"{tech_level:.2f}",
-                    f"{bio_type}/{org_type}",
+                    bio_org,
                     motivation,
                 ]
             )
@@ -130,104 +561,30 @@ class SimulationReporter:
         # Extract recent events
         events = []
         for civ in universe.civilizations.values():
-            recent_events = civ.history[-2:] if len(civ.history) >= 2 else civ.history
-            for event in recent_events:
-                date = event["date"]
-                event_type = event["event"]
-                civ_name = civ.params.name
-
-                # Format event details
-                details = ""
-                if event_type == "expansion":
-                    from_star = event["data"].get("from_star", "unknown")
-                    to_star = event["data"].get("to_star", "unknown")
-                    details = (
-                        f"expanded from star_{from_star[-1:]} to star_{to_star[-1:]}"
-                    )
-                elif event_type == "tech_exchange":
-                    with_civ = event["data"].get("with_civilization", "unknown")
-                    boost = event["data"].get("tech_boost", 0)
-                    details = f"gained {boost:.3f} tech from {with_civ}"
-                elif event_type == "conflict_won" or event_type == "conflict_lost":
-                    against = event["data"].get("against_civilization", "unknown")
-                    at_star = event["data"].get("at_star", "unknown")
-                    details = f"{event_type} against {against} at star_{at_star[-1:]}"
-
+            # Raw payloads of the two latest events; no event dicts are built
+            civ_name = civ.params.name
+            for date, kind, payload in civ.history.recent(2):
                 events.append(
                     {
                         "date": date,
                         "civ_name": civ_name,
-                        "event_type": event_type,
-                        "details": details,
+                        "event_type": kind.event_name,
+                        "details": format_event_details(kind, payload),
                     }
                 )
 
-        # Sort events by date (most recent first)
-        events.sort(key=lambda x: x["date"], reverse=True)
-        events = events[:6]  # Limit to 6 most recent events
-
-        # Add to HTML file
-        with open(self.html_file, "a") as f:
-            f.write(
-                f"""
-    <div class="step">
-        <h2>Step {step} (Date: {universe.current_date})</h2>
-        <p>{universe_summary}</p>
-        
-        <h3>Civilization Status</h3>
-        <table>
-            <tr>
-"""
-            )
-            # Write headers
-            for header in headers:
-                f.write(f"                <th>{header}</th>\n")
-            f.write("            </tr>\n")
-
-            # Write rows
-            for row in rows:
-                f.write("            <tr>\n")
-                for cell in row:
-                    f.write(f"                <td>{cell}</td>\n")
-                f.write("            </tr>\n")
-
-            f.write(
-                """        </table>
-        
-        <h3>Recent Events</h3>
-        <div class="events">
-"""
-            )
-
-            # Write events
-            for event in events:
-                f.write(
-                    f'            <div class="event">[{event["date"]:.0f}] {event["civ_name"]}: {event["event_type"]} - {event["details"]}</div>\n'
-                )
-
-            f.write(
-                """        </div>
-    </div>
-"""
-            )
-
-        # Add to text file
-        with open(self.txt_file, "a") as f:
-            f.write(f"\n{'='*50}\n")
-            f.write(f"STEP {step} (Date: {universe.current_date})\n")
-            f.write(f"{'='*50}\n\n")
-            f.write(f"{universe_summary}\n\n")
-
-            f.write("CIVILIZATION STATUS:\n")
-            f.write(tabulate(rows, headers, tablefmt="grid"))
-            f.write("\n\nRECENT EVENTS:\n")
+        # Keep the 6 most recent events, most recent first
+        events = heapq.nlargest(6, events, key=lambda x: x["date"])
 
-            for event in events:
-                f.write(
-                    f'[{event["date"]:.0f}] {event["civ_name"]}: {event["event_type"]} - {event["details"]}\n'
-                )
-
-            f.write("\n")
+        step_data = {
+            "step": step,
+            "date": universe.current_date,
+            "universe_summary": universe_summary,
+            "rows": rows,
+            "events": events,
+        }
+        for sink in self._step_sinks:
+            sink.on_step(step_data)
 
     def add_final_summary(self, universe):
         """Add a final summary of the simulation"""
@@ -241,7 +598,7 @@ class SimulationReporter:
         # Add details for each civilization
         for civ_id, civ in universe.civilizations.items():
             colony_count = len(civ.colonies)
-            max_pop_colony = max(civ.colonies.values()) if civ.colonies else 0
+            max_pop_colony = civ.get_largest_colony_population()
             total_pop = civ.get_total_population()
             tech_growth = civ.params.tech_level / 1.0  # Compared to starting level
 
@@ -255,202 +612,226 @@ class SimulationReporter:
             summary.append(f"  Largest colony: {max_pop_colony:.1e}")
             summary.append("")
 
-        # Add to HTML file
-        with open(self.html_file, "a") as f:
-            f.write(
-                """
-    <div class="summary">
-        <h2>Final Results</h2>
-"""
-            )
-            for line in summary:
-                if line.endswith(":"):
-                    f.write(f"        <h3>{line[:-1]}</h3>\n")
-                elif line == "":
-                    f.write("        <br>\n")
-                else:
-                    f.write(f"        <p>{line}</p>\n")
-
-            f.write(
-                """    </div>
-</body>
-</html>
-"""
-            )
-
-        # Add to text file
-        with open(self.txt_file, "a") as f:
-            f.write("\n" + "=" * 50 + "\n")
-            f.write("FINAL RESULTS\n")
-            f.write("=" * 50 + "\n\n")
-            f.write("\n".join(summary))
+        for sink in self.sinks:
+            sink.on_final(summary)
 
-        # Create a separate summary file
-        with open(self.summary_file, "w") as f:
-            f.write("INTERSTELLAR CIVILIZATION SIMULATION - SUMMARY\n")
-            f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write("\n".join(summary))
+        # Make the reports complete on disk even before close()
+        self.flush()
 
     def save_visualizations(self, universe, visualizer):
-        """Save visualizations as image files"""
-        # Create visualization directory
-        vis_dir = f"{self.output_dir}/visualizations"
-        if not os.path.exists(vis_dir):
-            os.makedirs(vis_dir)
-
-        # Save 3D state
-        fig1, _ = visualizer.plot_3d_state()
-        fig1.savefig(f"{vis_dir}/universe_3d_state.png", dpi=300)
-
-        # Save population history
-        fig2, _ = visualizer.plot_population_history()
-        fig2.savefig(f"{vis_dir}/population_history.png", dpi=300)
-
-        # Save technology history
-        fig3, _ = visualizer.plot_tech_history()
-        fig3.savefig(f"{vis_dir}/tech_history.png", dpi=300)
-
-        # Save expansion history
-        fig4, _ = visualizer.plot_expansion_history()
-        fig4.savefig(f"{vis_dir}/expansion_history.png", dpi=300)
-
-        # Add links to HTML report
-        with open(self.html_file, "a") as f:
-            f.write(
-                """
-    <div class="visualizations">
-        <h2>Visualizations</h2>
-        <p>These visualizations show the simulation results:</p>
-        <ul>
-            <li><a href="visualizations/universe_3d_state.png">3D Universe State</a></li>
-            <li><a href="visualizations/population_history.png">Population History</a></li>
-            <li><a href="visualizations/tech_history.png">Technology History</a></li>
-            <li><a href="visualizations/expansion_history.png">Expansion History</a></li>
-        </ul>
-    </div>
-"""
-            )
-
-        print(f"Visualizations saved to {vis_dir}/")
-
-        # Return figures for display
-        return [fig1, fig2, fig3, fig4]
+        """
+        Save visualizations as image files.
+
+        The figures are only drawn if a sink saves them (see PngSink).
+
+        Args:
+            universe: The simulated universe
+            visualizer: UniverseVisualizer used to draw the figures
+
+        Returns:
+            The figures, for display (empty if no sink saves figures)
+        """
+        figure_sinks = [sink for sink in self.sinks if sink.saves_figures]
+        if not figure_sinks:
+            return []
+
+        # Build the figures (pyplot state is only touched from this thread)
+        figures = [
+            ("universe_3d_state", "3D Universe State", visualizer.plot_3d_state()[0]),
+            (
+                "population_history",
+                "Population History",
+                visualizer.plot_population_history()[0],
+            ),
+            ("tech_history", "Technology History", visualizer.plot_tech_history()[0]),
+            (
+                "expansion_history",
+                "Expansion History",
+                visualizer.plot_expansion_history()[0],
+            ),
+        ]
+        images = []
+        for sink in figure_sinks:
+            images += sink.save_figures(figures)
+
+        figs = [fig for _, _, fig in figures]
+        if not _can_show_figures():
+            # Nothing will display the figures, so free them now
+            for fig in figs:
+                plt.close(fig)
+
+        for sink in self.sinks:
+            sink.on_visualizations(images)
+        self.flush()
+
+        # Return figures for display (already closed if there is no display)
+        return figs
+
+    def flush(self):
+        """Write any buffered report output to disk"""
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        """
+        Flush and close the report files (the HTML report is only complete
+        once closed). Use the reporter as a context manager to make sure this
+        happens even if the simulation fails.
+        """
+        if not self._closed:
+            self._closed = True
+            self._close_sinks(self.sinks)
+
+    @staticmethod
+    def _close_sinks(sinks):
+        """Close every sink, even if closing one of them fails"""
+        error = None
+        for sink in sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                error = error or e
+        if error is not None:
+            raise error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
 
 def main():
-    # Initialize reporter
-    reporter = SimulationReporter()
-
-    # Create a universe with a smaller number of stars
-    universe = Universe(size=500.0)
-    universe.initialize_stars(300)
-
-    # Find a star with good resources for the first civilization
-    stars = sorted(universe.get_all_stars(), key=lambda s: s.resources, reverse=True)
-    star1 = stars[0]
-
-    # Create a cooperative, expansion-focused civilization
-    civ1_params = CivilizationParams(
-        id="civ_1",
-        name="Explorers",
-        origin_star=star1,
-        population=1e6,
-        reproduction_rate=0.01,
-        individual_lifespan=100,
-        expansion_rate=0.08,  # High expansion rate
-        expansion_range=100,
-        cooperation_factor=0.7,  # Cooperative
-        aggression_factor=0.3,
-        founding_date=0,
-        tech_level=1.0,
-        tech_advancement_rate=0.005,
-        time_horizon=1000,
-        biological_type="biological",
-        organization_type="individual",
-        motivation="expansion",  # Focused on expansion
-    )
-    civ1 = Civilization(civ1_params)
-    universe.add_civilization(civ1)
-
-    # Create a knowledge-focused civilization
-    star2 = stars[10]  # Use a different star
-    civ2_params = CivilizationParams(
-        id="civ_2",
-        name="Scholars",
-        origin_star=star2,
-        population=8e5,
-        reproduction_rate=0.008,
-        individual_lifespan=120,
-        expansion_rate=0.03,  # Lower expansion rate
-        expansion_range=80,
-        cooperation_factor=0.8,  # Very cooperative
-        aggression_factor=0.2,
-        founding_date=0,
-        tech_level=1.2,  # Start with higher tech
-        tech_advancement_rate=0.01,  # Faster tech advancement
-        time_horizon=1500,
-        biological_type="hybrid",
-        organization_type="hive",
-        motivation="knowledge",  # Focused on knowledge
+    parser = argparse.ArgumentParser(
+        description="Run a simulation and save reports to files"
     )
-    civ2 = Civilization(civ2_params)
-    universe.add_civilization(civ2)
-
-    # Create an aggressive, resource-focused civilization
-    star3 = stars[20]  # Use a different star
-    civ3_params = CivilizationParams(
-        id="civ_3",
-        name="Conquerors",
-        origin_star=star3,
-        population=1.2e6,
-        reproduction_rate=0.012,
-        individual_lifespan=80,
-        expansion_rate=0.06,
-        expansion_range=90,
-        cooperation_factor=0.2,  # Not cooperative
-        aggression_factor=0.8,  # Aggressive
-        founding_date=0,
-        tech_level=0.9,
-        tech_advancement_rate=0.004,
-        time_horizon=500,
-        biological_type="biological",
-        organization_type="individual",
-        motivation="resource",  # Focused on resources
+    parser.add_argument(
+        "--outputs",
+        nargs="+",
+        choices=list(_SINKS),
+        default=list(_SINKS),
+        help="Report outputs to write (all by default)",
     )
-    civ3 = Civilization(civ3_params)
-    universe.add_civilization(civ3)
-
-    # Add initial state to report
-    reporter.add_step_report(universe, 0)
-
-    # Run the simulation
-    print("Running simulation with reports every 10 steps...")
-    total_steps = 200
-
-    for step in range(1, total_steps + 1):
-        universe.update()
-
-        # Add report every 10 steps
-        if step % 10 == 0:
-            print(f"Processing step {step}/{total_steps}...")
-            reporter.add_step_report(universe, step)
-
-    # Add final summary
-    print("Creating final summary...")
-    reporter.add_final_summary(universe)
-
-    # Create visualizer and save visualizations
-    print("Generating and saving visualizations...")
-    visualizer = UniverseVisualizer(universe)
-    figures = reporter.save_visualizations(universe, visualizer)
+    args = parser.parse_args()
+
+    # Initialize reporter (closed, which completes the reports, when the
+    # with block ends)
+    with SimulationReporter(
+        sinks=[_SINKS[name]() for name in args.outputs]
+    ) as reporter:
+        # Create a universe with a smaller number of stars
+        universe = Universe(size=500.0)
+        universe.initialize_stars(300)
+
+        # Find a star with good resources for the first civilization
+        # (only the top 21 stars are needed, so select them instead of sorting all)
+        stars = heapq.nlargest(21, universe.get_all_stars(), key=lambda s: s.resources)
+        star1 = stars[0]
+
+        # Create a cooperative, expansion-focused civilization
+        civ1_params = CivilizationParams(
+            id="civ_1",
+            name="Explorers",
+            origin_star=star1,
+            population=1e6,
+            reproduction_rate=0.01,
+            individual_lifespan=100,
+            expansion_rate=0.08,  # High expansion rate
+            expansion_range=100,
+            cooperation_factor=0.7,  # Cooperative
+            aggression_factor=0.3,
+            founding_date=0,
+            tech_level=1.0,
+            tech_advancement_rate=0.005,
+            time_horizon=1000,
+            biological_type="biological",
+            organization_type="individual",
+            motivation="expansion",  # Focused on expansion
+        )
+        civ1 = Civilization(civ1_params)
+        universe.add_civilization(civ1)
+
+        # Create a knowledge-focused civilization
+        star2 = stars[10]  # Use a different star
+        civ2_params = CivilizationParams(
+            id="civ_2",
+            name="Scholars",
+            origin_star=star2,
+            population=8e5,
+            reproduction_rate=0.008,
+            individual_lifespan=120,
+            expansion_rate=0.03,  # Lower expansion rate
+            expansion_range=80,
+            cooperation_factor=0.8,  # Very cooperative
+            aggression_factor=0.2,
+            founding_date=0,
+            tech_level=1.2,  # Start with higher tech
+            tech_advancement_rate=0.01,  # Faster tech advancement
+            time_horizon=1500,
+            biological_type="hybrid",
+            organization_type="hive",
+            motivation="knowledge",  # Focused on knowledge
+        )
+        civ2 = Civilization(civ2_params)
+        universe.add_civilization(civ2)
+
+        # Create an aggressive, resource-focused civilization
+        star3 = stars[20]  # Use a different star
+        civ3_params = CivilizationParams(
+            id="civ_3",
+            name="Conquerors",
+            origin_star=star3,
+            population=1.2e6,
+            reproduction_rate=0.012,
+            individual_lifespan=80,
+            expansion_rate=0.06,
+            expansion_range=90,
+            cooperation_factor=0.2,  # Not cooperative
+            aggression_factor=0.8,  # Aggressive
+            founding_date=0,
+            tech_level=0.9,
+            tech_advancement_rate=0.004,
+            time_horizon=500,
+            biological_type="biological",
+            organization_type="individual",
+            motivation="resource",  # Focused on resources
+        )
+        civ3 = Civilization(civ3_params)
+        universe.add_civilization(civ3)
+
+        # Add initial state to report
+        reporter.add_step_report(universe, 0)
+
+        # Run the simulation
+        print("Running simulation with reports every 10 steps...")
+        total_steps = 200
+
+        for step in range(1, total_steps + 1):
+            universe.update()
+
+            # Add report every 10 steps
+            if step % 10 == 0:
+                print(f"Processing step {step}/{total_steps}...")
+                reporter.add_step_report(universe, step)
+
+        # Add final summary
+        print("Creating final summary...")
+        reporter.add_final_summary(universe)
+
+        # Create visualizer and save visualizations
+        figures = []
+        if "png" in args.outputs:
+            print("Generating and saving visualizations...")
+            visualizer = UniverseVisualizer(universe)
+            figures = reporter.save_visualizations(universe, visualizer)
 
     print("\nSimulation report complete!")
-    print(f"HTML Report: {reporter.html_file}")
-    print(f"Text Report: {reporter.txt_file}")
-    print(f"Summary: {reporter.summary_file}")
+    for label, path in reporter.report_paths.items():
+        print(f"{label}: {path}")
 
     # Display visualizations
-    plt.show()
+    if figures and _can_show_figures():
+        plt.show()
 
 
 if __name__ == "__main__":
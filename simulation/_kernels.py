@@ -0,0 +1,54 @@
+"""
+Numeric kernels for the visualization hot loops.
+
+When Numba is installed the kernels are JIT-compiled (and cached on disk, so
+the compile cost is only paid once per machine). Without Numba, equivalent
+vectorized NumPy versions are used instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
+
+
+def _colony_sizes_numpy(populations, offsets):
+    """
+    Marker size of every colony point, from 10 up to 50 for each
+    civilization's largest colony. Civilization i owns the (non-empty) slice
+    populations[offsets[i]:offsets[i + 1]].
+    """
+    largest = np.maximum.reduceat(populations, offsets[:-1])
+    largest = np.repeat(largest, np.diff(offsets))
+    # A civilization without population gets the minimum size everywhere
+    largest[largest <= 0] = 1.0
+    return 10 + 40 * (populations / largest)
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def colony_sizes(populations, offsets):
+        """
+        Marker size of every colony point, from 10 up to 50 for each
+        civilization's largest colony. Civilization i owns the (non-empty) slice
+        populations[offsets[i]:offsets[i + 1]].
+        """
+        sizes = np.empty(populations.size)
+        for c in range(offsets.size - 1):
+            lo = offsets[c]
+            hi = offsets[c + 1]
+            largest = populations[lo]
+            for i in range(lo + 1, hi):
+                if populations[i] > largest:
+                    largest = populations[i]
+            if largest <= 0:
+                largest = 1.0
+            for i in range(lo, hi):
+                sizes[i] = 10 + 40 * (populations[i] / largest)
+        return sizes
+
+else:
+    colony_sizes = _colony_sizes_numpy
@@ -1,11 +1,29 @@
+from collections import Counter
+from contextlib import contextmanager
+import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.lines import Line2D
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
-import pandas as pd
+from models import EventKind
+from ._kernels import colony_sizes
+
+try:
+    from vispy import scene
+except ImportError:  # VisPy is optional
+    scene = None
+
+
+# Helper functions to convert matplotlib colors to hex format
+def colors_to_hex(colors):
+    """Convert an (N, 3) or (N, 4) array of RGB(A) colors to hex strings"""
+    rgb = np.asarray(colors, dtype=np.float64)[:, :3]
+    rgb = (np.clip(rgb, 0, 1) * 255).astype(np.uint8)
+    return ["#%02x%02x%02x" % tuple(row) for row in rgb.tolist()]
 
 
-# Helper function to convert matplotlib colors to hex format
 def color_to_hex(color):
     """Convert matplotlib color to hex string"""
     if isinstance(color, str):
@@ -14,15 +32,32 @@ def color_to_hex(color):
     if isinstance(color, tuple) or isinstance(color, np.ndarray):
         # Convert RGB(A) to hex
         if len(color) >= 3:
-            r, g, b = color[:3]
-            r = min(max(int(r * 255), 0), 255)
-            g = min(max(int(g * 255), 0), 255)
-            b = min(max(int(b * 255), 0), 255)
-            return f"#{r:02x}{g:02x}{b:02x}"
+            return colors_to_hex([color])[0]
 
     return "#000000"  # Default to black if conversion fails
 
 
+@contextmanager
+def _defer_draw(fig):
+    """
+    Suspend interactive redraws while a figure is being built.
+
+    In interactive mode pyplot redraws after every change; inside this block
+    it doesn't, and a single idle redraw is requested at the end instead.
+    """
+    if not plt.isinteractive():
+        # Nothing redraws until the figure is shown or saved anyway
+        yield
+        return
+
+    plt.ioff()
+    try:
+        yield
+    finally:
+        plt.ion()
+        fig.canvas.draw_idle()
+
+
 class UniverseVisualizer:
     """
     Visualization tools for the universe simulation.
@@ -41,8 +76,14 @@ class UniverseVisualizer:
         """
         self.universe = universe
         self.colors = plt.cm.tab10.colors  # Color cycle for civilizations
-
-    def plot_3d_state(self, ax=None, fig=None, show_labels=True, highlight_civs=None):
+        self.hex_colors = colors_to_hex(self.colors)  # Same colors, as hex strings
+        # Figure and axis reused by plot_3d_state(reuse=True)
+        self._cached_fig = None
+        self._cached_ax = None
+
+    def plot_3d_state(
+        self, ax=None, fig=None, show_labels=True, highlight_civs=None, reuse=False
+    ):
         """
         Plot the current state of the universe in 3D.
 
@@ -51,136 +92,318 @@ class UniverseVisualizer:
             fig: Optional matplotlib figure
             show_labels: Whether to show civilization labels
             highlight_civs: List of civilization IDs to highlight
+            reuse: If no axis is given, clear and redraw the figure from the
+                previous reuse=True call instead of creating a new one (useful
+                when taking repeated snapshots)
 
         Returns:
             fig, ax: The figure and axis objects
         """
+        if ax is None and reuse:
+            fig, ax = self._reusable_3d_axes()
+        fig, ax, _ = self._draw_3d_state(ax, fig, show_labels, highlight_civs)
+        return fig, ax
+
+    def _colony_sizes(self, populations):
+        """Marker sizes for a list of per-civilization colony population arrays"""
+        offsets = np.zeros(len(populations) + 1, dtype=np.intp)
+        np.cumsum([pops.size for pops in populations], out=offsets[1:])
+        return colony_sizes(np.concatenate(populations), offsets)
+
+    def _reusable_3d_axes(self):
+        """Return the cached 3D figure and axis, cleared, creating them if needed"""
+        fig = self._cached_fig
+        if fig is not None and plt.fignum_exists(fig.number):
+            if self._cached_ax in fig.axes:
+                # Clearing is much cheaper than building a new figure
+                self._cached_ax.cla()
+                for text in list(fig.texts):
+                    text.remove()
+                return fig, self._cached_ax
+            # The cached axis was removed (e.g. by fig.clf()), so the figure
+            # is replaced; close it so it doesn't linger in pyplot
+            plt.close(fig)
+
+        fig = plt.figure(figsize=(12, 10))
+        ax = fig.add_subplot(111, projection="3d")
+        self._cached_fig, self._cached_ax = fig, ax
+        return fig, ax
+
+    def _draw_3d_state(self, ax, fig, show_labels, highlight_civs):
+        """
+        Draw the current state of the universe in 3D (see plot_3d_state).
+
+        Returns:
+            fig, ax, colonies: The figure and axis objects, and the batch of
+                colony points as (artist, positions, sizes, colors, visit dates),
+                or None if no civilization has visited a star
+        """
         if ax is None:
             fig = plt.figure(figsize=(12, 10))
             ax = fig.add_subplot(111, projection="3d")
 
-        # Plot stars as small points
-        positions = np.array([star.position for star in self.universe.stars.values()])
-        resources = np.array([star.resources for star in self.universe.stars.values()])
-
-        # Plot all stars as small points
-        ax.scatter(
-            positions[:, 0],
-            positions[:, 1],
-            positions[:, 2],
-            c="lightgray",
-            s=1,
-            alpha=0.5,
-        )
-
-        # Collect civilization data for parameters text box
-        civ_params_text = "Initial Civilization Parameters:\n"
-        civ_params_text += "--------------------------------\n"
-
-        # Plot civilizations
-        for i, civ in enumerate(self.universe.civilizations.values()):
-            # Get positions of stars visited by this civilization
-            civ_stars = [
-                self.universe.stars[star_id] for star_id in civ.visited_stars.keys()
-            ]
-            if not civ_stars:
-                continue
+        with _defer_draw(ax.figure):
+            # Star positions are kept in one array by the universe
+            positions = self.universe.star_positions()
 
-            civ_positions = np.array([star.position for star in civ_stars])
-            pop_sizes = np.array([civ.colonies.get(star.id, 0) for star in civ_stars])
-            if pop_sizes.max() > 0:
-                sizes = 10 + 40 * (pop_sizes / pop_sizes.max())
-            else:
-                sizes = 10
+            # Plot all stars as small points
+            ax.scatter(
+                positions[:, 0],
+                positions[:, 1],
+                positions[:, 2],
+                c="lightgray",
+                s=1,
+                alpha=0.5,
+                # Drawn as one image in vector output (PDF/SVG) rather than a
+                # path per star
+                rasterized=True,
+            )
 
-            # Color based on civilization
-            color = self.colors[i % len(self.colors)]
+            # Collect civilization data for parameters text box (only shown,
+            # and so only built, with labels)
+            if show_labels:
+                civ_params_text = "Initial Civilization Parameters:\n"
+                civ_params_text += "--------------------------------\n"
+
+            # Colonies of all civilizations are gathered into one batch and drawn
+            # with a single scatter call (the origin stars with another), since
+            # matplotlib's drawing cost grows with the number of artists
+            colony_positions = []
+            colony_populations = []
+            colony_dates = []
+            origin_rows = []
+            origin_colors = []
+            legend_handles = []
+            # Scratch per-star population array, all zeros between civilizations
+            colony_pops = np.zeros(len(positions))
+
+            # Plot civilizations
+            for i, civ in enumerate(self.universe.civilizations.values()):
+                # Get positions of stars visited by this civilization
+                rows = civ.visited_star_ids
+                if rows.size == 0:
+                    continue
+
+                civ_positions = positions[rows]
+                # Scatter the colony populations (stored by star row) over a
+                # per-star array, read them back for the visited stars, then
+                # clear them again
+                civ_colonies = civ.colonies
+                colony_pops[civ_colonies.star_rows] = civ_colonies.populations
+                colony_populations.append(colony_pops[rows])
+                colony_pops[civ_colonies.star_rows] = 0
+
+                # Color based on civilization
+                color = self.colors[i % len(self.colors)]
+
+                # Highlight if requested
+                alpha = 1.0
+                highlight = False
+                if highlight_civs is not None:
+                    if civ.params.id not in highlight_civs:
+                        alpha = 0.3
+                    else:
+                        highlight = True
+                rgba = mcolors.to_rgba(color, alpha)
+
+                # Colonies
+                colony_positions.append(civ_positions)
+                colony_dates.append(
+                    np.fromiter(
+                        civ.visited_stars.values(), dtype=np.float64, count=rows.size
+                    )
+                )
+                legend_handles.append(
+                    Line2D(
+                        [],
+                        [],
+                        linestyle="none",
+                        marker="o",
+                        color=rgba,
+                        label=civ.params.name,
+                    )
+                )
 
-            # Highlight if requested
-            alpha = 1.0
-            highlight = False
-            if highlight_civs is not None:
-                if civ.params.id not in highlight_civs:
-                    alpha = 0.3
+                # The civilization's home star
+                origin_star = civ.params.origin_star
+                origin_rows.append(origin_star.row_index)
+                origin_colors.append(rgba)
+
+                if not show_labels:
+                    continue
+
+                # Add a text label near the origin star only for highlighted civs
+                if highlight_civs is None or highlight:
+                    ax.text(
+                        origin_star.position[0],
+                        origin_star.position[1],
+                        origin_star.position[2],
+                        civ.params.name,
+                        color=color,
+                        fontsize=8,
+                    )
+
+                # Add civilization parameters to the text box
+                civ_params_text += f"\n{civ.params.name} ({self.hex_colors[i % len(self.hex_colors)]}):\n"
+                civ_params_text += f"  Type: {civ.params.biological_type}/{civ.params.organization_type}\n"
+                civ_params_text += f"  Motivation: {civ.params.motivation}\n"
+                civ_params_text += f"  Tech: {civ.params.tech_level:.2f} (growth rate: {civ.params.tech_advancement_rate:.4f})\n"
+                civ_params_text += (
+                    f"  Expansion rate: {civ.params.expansion_rate:.2f}\n"
+                )
+                civ_params_text += f"  Cooperation/Aggression: {civ.params.cooperation_factor:.2f}/{civ.params.aggression_factor:.2f}\n"
+
+            colonies = None
+            if colony_positions:
+                colony_positions = np.concatenate(colony_positions)
+                point_sizes = self._colony_sizes(colony_populations)
+
+                # Each point takes its civilization's color (origin_colors has
+                # one per civilization). Alpha is set once on the collection
+                # unless highlighting mixes alphas, which needs per-point RGBA.
+                palette = np.array(origin_colors)
+                point_civs = np.repeat(
+                    np.arange(len(palette)),
+                    [pops.size for pops in colony_populations],
+                )
+                alphas = palette[:, 3]
+                if (alphas == alphas[0]).all():
+                    colony_colors = palette[point_civs, :3]
+                    colony_alpha = alphas[0]
                 else:
-                    highlight = True
-
-            # Plot colonies
-            scatter = ax.scatter(
-                civ_positions[:, 0],
-                civ_positions[:, 1],
-                civ_positions[:, 2],
-                s=sizes,
-                c=[color],
-                alpha=alpha,
-                label=civ.params.name,
-            )
+                    colony_colors = palette[point_civs]
+                    colony_alpha = None
+
+                colony_artist = ax.scatter(
+                    colony_positions[:, 0],
+                    colony_positions[:, 1],
+                    colony_positions[:, 2],
+                    s=point_sizes,
+                    c=colony_colors,
+                    alpha=colony_alpha,
+                )
+                colonies = (
+                    colony_artist,
+                    colony_positions,
+                    point_sizes,
+                    colony_colors,
+                    np.concatenate(colony_dates),
+                )
 
-            # Highlight the civilization's home star
-            origin_star = civ.params.origin_star
-            ax.scatter(
-                origin_star.position[0],
-                origin_star.position[1],
-                origin_star.position[2],
-                s=100,
-                c=[color],
-                marker="*",
-                alpha=alpha,
-                edgecolor="white",
-            )
+                # Highlight the home stars
+                # Gather the home star coordinates from the position array
+                origin_positions = positions[origin_rows]
+                ax.scatter(
+                    origin_positions[:, 0],
+                    origin_positions[:, 1],
+                    origin_positions[:, 2],
+                    s=100,
+                    c=np.array(origin_colors),
+                    marker="*",
+                    edgecolor="white",
+                )
 
-            # Add a text label near the origin star only for highlighted civs
-            if show_labels and (highlight_civs is None or highlight):
-                ax.text(
-                    origin_star.position[0],
-                    origin_star.position[1],
-                    origin_star.position[2],
-                    civ.params.name,
-                    color=color,
+            # Set limits and labels
+            max_range = self.universe.size / 2
+            ax.set_xlim(-max_range, max_range)
+            ax.set_ylim(-max_range, max_range)
+            ax.set_zlim(-max_range, max_range)
+
+            ax.set_xlabel("X")
+            ax.set_ylabel("Y")
+            ax.set_zlabel("Z")
+
+            ax.set_title(f"Universe at time {self.universe.current_date:.0f}")
+
+            if show_labels:
+                # The batched scatter has no per-civilization label, so the legend
+                # gets one proxy handle per civilization
+                ax.legend(handles=legend_handles, loc="upper right")
+
+                # Add a text box with civilization parameters in the bottom right
+                props = dict(boxstyle="round", facecolor="wheat", alpha=0.5)
+                fig.text(
+                    0.95,
+                    0.05,
+                    civ_params_text,
                     fontsize=8,
+                    verticalalignment="bottom",
+                    horizontalalignment="right",
+                    bbox=props,
+                    transform=fig.transFigure,
                 )
 
-            # Add civilization parameters to the text box
-            civ_params_text += f"\n{civ.params.name} ({color_to_hex(color)}):\n"
-            civ_params_text += (
-                f"  Type: {civ.params.biological_type}/{civ.params.organization_type}\n"
-            )
-            civ_params_text += f"  Motivation: {civ.params.motivation}\n"
-            civ_params_text += f"  Tech: {civ.params.tech_level:.2f} (growth rate: {civ.params.tech_advancement_rate:.4f})\n"
-            civ_params_text += f"  Expansion rate: {civ.params.expansion_rate:.2f}\n"
-            civ_params_text += f"  Cooperation/Aggression: {civ.params.cooperation_factor:.2f}/{civ.params.aggression_factor:.2f}\n"
-
-        # Set limits and labels
-        max_range = self.universe.size / 2
-        ax.set_xlim(-max_range, max_range)
-        ax.set_ylim(-max_range, max_range)
-        ax.set_zlim(-max_range, max_range)
-
-        ax.set_xlabel("X")
-        ax.set_ylabel("Y")
-        ax.set_zlabel("Z")
-
-        ax.set_title(f"Universe at time {self.universe.current_date:.0f}")
-
-        if show_labels:
-            plt.legend(loc="upper right")
-
-        # Add the parameters text box if show_labels is True
-        if show_labels:
-            # Add a text box with civilization parameters in the bottom right
-            props = dict(boxstyle="round", facecolor="wheat", alpha=0.5)
-            fig.text(
-                0.95,
-                0.05,
-                civ_params_text,
-                fontsize=8,
-                verticalalignment="bottom",
-                horizontalalignment="right",
-                bbox=props,
-                transform=fig.transFigure,
+        return fig, ax, colonies
+
+    def plot_3d_state_vispy(self, highlight_civs=None):
+        """
+        Plot the current state of the universe in 3D on the GPU with VisPy.
+
+        Stars and colonies are each drawn as one OpenGL marker visual, which
+        stays interactive for far more stars than matplotlib's 3D axes.
+        Requires the optional `vispy` package.
+
+        Args:
+            highlight_civs: List of civilization IDs to highlight
+
+        Returns:
+            canvas: The VisPy SceneCanvas (show it with `canvas.show()` and
+                `vispy.app.run()`)
+        """
+        if scene is None:
+            raise ImportError("plot_3d_state_vispy requires VisPy (pip install vispy)")
+
+        canvas = scene.SceneCanvas(
+            keys="interactive",
+            size=(1200, 1000),
+            bgcolor="white",
+            title=f"Universe at time {self.universe.current_date:.0f}",
+        )
+        view = canvas.central_widget.add_view()
+        view.camera = scene.TurntableCamera(fov=45)
+
+        # All stars as small points
+        positions = self.universe.star_positions()
+        stars = scene.visuals.Markers(parent=view.scene)
+        stars.set_data(
+            positions, size=2, edge_width=0, face_color=(0.83, 0.83, 0.83, 0.5)
+        )
+
+        # Colonies of all civilizations, sized and colored as in plot_3d_state
+        colony_positions = []
+        colony_populations = []
+        colony_colors = []
+        colony_pops = np.zeros(len(positions))
+        for i, civ in enumerate(self.universe.civilizations.values()):
+            rows = civ.visited_star_ids
+            if rows.size == 0:
+                continue
+
+            civ_colonies = civ.colonies
+            colony_pops[civ_colonies.star_rows] = civ_colonies.populations
+            colony_populations.append(colony_pops[rows])
+            colony_pops[civ_colonies.star_rows] = 0
+
+            alpha = 1.0
+            if highlight_civs is not None and civ.params.id not in highlight_civs:
+                alpha = 0.3
+            rgba = mcolors.to_rgba(self.colors[i % len(self.colors)], alpha)
+
+            colony_positions.append(positions[rows])
+            colony_colors.append(np.tile(rgba, (rows.size, 1)))
+
+        if colony_positions:
+            colonies = scene.visuals.Markers(parent=view.scene)
+            colonies.set_data(
+                np.concatenate(colony_positions),
+                # Marker sizes are diameters in pixels, scatter sizes are areas
+                size=np.sqrt(self._colony_sizes(colony_populations)),
+                edge_width=0,
+                face_color=np.concatenate(colony_colors),
             )
 
-        return fig, ax
+        view.camera.set_range()
+        return canvas
 
     def plot_population_history(self):
         """
@@ -191,25 +414,27 @@ class UniverseVisualizer:
         """
         fig, ax = plt.subplots(figsize=(10, 6))
 
+        curves = []
         for i, civ in enumerate(self.universe.civilizations.values()):
             history = civ.population_history
             if not history:
                 continue
 
-            dates, populations = zip(*history)
-            ax.plot(
-                dates,
-                populations,
-                label=civ.params.name,
-                color=self.colors[i % len(self.colors)],
+            # The history buffer exposes its columns as arrays (no unpacking)
+            curves.append(
+                (
+                    history.array,
+                    civ.params.name,
+                    self.colors[i % len(self.colors)],
+                )
             )
+        self._plot_curves(ax, curves)
 
         ax.set_xlabel("Time")
         ax.set_ylabel("Population")
         ax.set_title("Civilization Population History")
         ax.set_yscale("log")
         ax.grid(True)
-        plt.legend()
 
         return fig, ax
 
@@ -222,24 +447,25 @@ class UniverseVisualizer:
         """
         fig, ax = plt.subplots(figsize=(10, 6))
 
+        curves = []
         for i, civ in enumerate(self.universe.civilizations.values()):
             history = civ.tech_history
             if not history:
                 continue
 
-            dates, tech_levels = zip(*history)
-            ax.plot(
-                dates,
-                tech_levels,
-                label=civ.params.name,
-                color=self.colors[i % len(self.colors)],
+            curves.append(
+                (
+                    history.array,
+                    civ.params.name,
+                    self.colors[i % len(self.colors)],
+                )
             )
+        self._plot_curves(ax, curves)
 
         ax.set_xlabel("Time")
         ax.set_ylabel("Technology Level")
         ax.set_title("Civilization Technology History")
         ax.grid(True)
-        plt.legend()
 
         return fig, ax
 
@@ -252,35 +478,70 @@ class UniverseVisualizer:
         """
         fig, ax = plt.subplots(figsize=(10, 6))
 
+        curves = []
         for i, civ in enumerate(self.universe.civilizations.values()):
             # Get the actual visit dates for each star from the visited_stars dictionary
-            visit_dates = sorted(
-                [(date, star_id) for star_id, date in civ.visited_stars.items()]
-            )
-
-            if not visit_dates:
+            num_visited = len(civ.visited_stars)
+            if num_visited == 0:
                 continue
 
-            # Create timeline of cumulative unique stars
-            dates = [d for d, _ in visit_dates]
+            dates = np.fromiter(
+                civ.visited_stars.values(), dtype=np.float64, count=num_visited
+            )
+            dates.sort()
+
             # Count unique stars at each date point (always adding 1 for each new star)
-            cumulative_counts = range(1, len(visit_dates) + 1)
+            cumulative_counts = np.arange(1, num_visited + 1)
 
-            ax.plot(
-                dates,
-                cumulative_counts,
-                label=f"{civ.params.name} ({len(civ.visited_stars)} stars)",
-                color=self.colors[i % len(self.colors)],
+            curves.append(
+                (
+                    np.column_stack((dates, cumulative_counts)),
+                    f"{civ.params.name} ({num_visited} stars)",
+                    self.colors[i % len(self.colors)],
+                )
             )
+        self._plot_curves(ax, curves)
 
         ax.set_xlabel("Time")
         ax.set_ylabel("Number of Unique Stars")
         ax.set_title("Civilization Expansion History (Unique Stars)")
         ax.grid(True)
-        plt.legend()
 
         return fig, ax
 
+    def _plot_curves(self, ax, curves):
+        """
+        Draw (points, label, color) curves as a single collection.
+
+        `points` is an (n, 2) array of (x, y) rows. One collection is much
+        cheaper to draw than a Line2D per curve; the legend gets a proxy line
+        for each curve instead.
+        """
+        if not curves:
+            return
+
+        # An unfilled, open PolyCollection draws the same polylines as a
+        # LineCollection, but its paths are also seen by the legend's "best"
+        # placement (a LineCollection's are not)
+        lines = PolyCollection(
+            [points for points, _, _ in curves],
+            closed=False,
+            facecolors="none",
+            edgecolors=[color for _, _, color in curves],
+            linewidths=plt.rcParams["lines.linewidth"],
+            # Match the look of ax.plot lines
+            capstyle="projecting",
+            joinstyle="round",
+            zorder=2,
+        )
+        ax.add_collection(lines)
+        ax.autoscale_view()
+        ax.legend(
+            handles=[
+                Line2D([], [], color=color, label=label) for _, label, color in curves
+            ]
+        )
+
     def create_expansion_animation(self, steps=100, interval=200):
         """
         Create an animation of the expansion of civilizations.
@@ -295,26 +556,47 @@ class UniverseVisualizer:
         fig = plt.figure(figsize=(12, 10))
         ax = fig.add_subplot(111, projection="3d")
 
-        # Initialize with empty plot
-        self.plot_3d_state(ax=ax, fig=fig)
+        # Draw everything once. Frames only update the colony points (showing
+        # the stars visited by each frame's date) and the date label, so with
+        # blitting the rest is never redrawn.
+        _, _, colonies = self._draw_3d_state(ax, fig, True, None)
+        ax.set_title("")
+        date_label = ax.text2D(
+            0.5, 0.95, "", transform=ax.transAxes, ha="center", va="top"
+        )
+
+        max_date = self.universe.current_date
+        dates = np.linspace(0, max_date, steps)
+
+        if colonies is not None:
+            artist, positions, sizes, colors, visit_dates = colonies
+            # Sort the points by visit date once: the points shown in a frame
+            # are then a prefix of these arrays, and each frame's prefix length
+            # comes from a single sweep over the sorted dates
+            order = np.argsort(visit_dates, kind="stable")
+            xs, ys, zs = positions[order].T
+            sizes = sizes[order]
+            colors = colors[order]
+            shown_counts = np.searchsorted(visit_dates[order], dates, side="right")
 
         # Update function for animation
         def update(frame):
-            ax.clear()
-            # Copy the universe
-            temp_universe = self.universe
-            # Set the date to the appropriate frame
-            temp_universe.current_date = frame
-            # Plot the state at this date
-            self.plot_3d_state(ax=ax, fig=fig, show_labels=False)
-            ax.set_title(f"Universe at time {frame}")
-            return (ax,)
+            date_label.set_text(f"Universe at time {dates[frame]:.0f}")
+            if colonies is None:
+                return (date_label,)
+
+            # Every frame's points are views into the sorted arrays
+            n = shown_counts[frame]
+            artist._offsets3d = (xs[:n], ys[:n], zs[:n])
+            artist.set_sizes(sizes[:n])
+            artist.set_facecolors(colors[:n])
+            # Blitting draws the artist on its own, so project it here
+            artist.do_3d_projection()
+            return artist, date_label
 
         # Create animation
-        max_date = self.universe.current_date
-        frames = np.linspace(0, max_date, steps)
         animation = FuncAnimation(
-            fig, update, frames=frames, interval=interval, blit=False
+            fig, update, frames=steps, interval=interval, blit=True
         )
 
         return animation
@@ -335,49 +617,57 @@ class UniverseVisualizer:
 
         fig, axs = plt.subplots(2, 2, figsize=(15, 10))
 
-        # Population history
-        if civ.population_history:
-            dates, populations = zip(*civ.population_history)
-            axs[0, 0].plot(dates, populations)
-            axs[0, 0].set_title(f"{civ.params.name} - Population History")
-            axs[0, 0].set_xlabel("Time")
-            axs[0, 0].set_ylabel("Population")
-            axs[0, 0].set_yscale("log")
-            axs[0, 0].grid(True)
-
-        # Technology history
-        if civ.tech_history:
-            dates, tech_levels = zip(*civ.tech_history)
-            axs[0, 1].plot(dates, tech_levels)
-            axs[0, 1].set_title(f"{civ.params.name} - Technology History")
-            axs[0, 1].set_xlabel("Time")
-            axs[0, 1].set_ylabel("Technology Level")
-            axs[0, 1].grid(True)
-
-        # Expansion events
-        expansion_events = [
-            (e["date"], e["data"]["to_star"])
-            for e in civ.history
-            if e["event"] == "expansion"
-        ]
-        if expansion_events:
-            dates, _ = zip(*expansion_events)
-            axs[1, 0].hist(dates, bins=20)
-            axs[1, 0].set_title(f"{civ.params.name} - Expansion Timeline")
-            axs[1, 0].set_xlabel("Time")
-            axs[1, 0].set_ylabel("Number of Expansions")
-            axs[1, 0].grid(True)
-
-        # Event counts
-        event_types = [e["event"] for e in civ.history]
-        if event_types:
-            event_counts = pd.Series(event_types).value_counts()
-            event_counts.plot(kind="bar", ax=axs[1, 1])
-            axs[1, 1].set_title(f"{civ.params.name} - Event Types")
-            axs[1, 1].set_xlabel("Event Type")
-            axs[1, 1].set_ylabel("Count")
-
-        plt.tight_layout()
+        with _defer_draw(fig):
+            # Population history
+            if civ.population_history:
+                history = civ.population_history
+                dates, populations = history.dates, history.values
+                axs[0, 0].plot(dates, populations)
+                axs[0, 0].set_title(f"{civ.params.name} - Population History")
+                axs[0, 0].set_xlabel("Time")
+                axs[0, 0].set_ylabel("Population")
+                axs[0, 0].set_yscale("log")
+                axs[0, 0].grid(True)
+
+            # Technology history
+            if civ.tech_history:
+                history = civ.tech_history
+                dates, tech_levels = history.dates, history.values
+                axs[0, 1].plot(dates, tech_levels)
+                axs[0, 1].set_title(f"{civ.params.name} - Technology History")
+                axs[0, 1].set_xlabel("Time")
+                axs[0, 1].set_ylabel("Technology Level")
+                axs[0, 1].grid(True)
+
+            # Expansion events
+            expansion_events = [
+                (e["date"], e["data"]["to_star"])
+                for e in civ.history
+                if e["event"] == "expansion"
+            ]
+            if expansion_events:
+                dates, _ = zip(*expansion_events)
+                axs[1, 0].hist(dates, bins=20)
+                axs[1, 0].set_title(f"{civ.params.name} - Expansion Timeline")
+                axs[1, 0].set_xlabel("Time")
+                axs[1, 0].set_ylabel("Number of Expansions")
+                axs[1, 0].grid(True)
+
+            # Event counts
+            if civ.history:
+                # Count the kinds column of the history (no event dicts needed),
+                # most common first
+                event_counts = Counter(civ.history.kinds.tolist()).most_common()
+                labels = [EventKind(kind).event_name for kind, _ in event_counts]
+                counts = [count for _, count in event_counts]
+                axs[1, 1].bar(labels, counts, width=0.5)
+                axs[1, 1].tick_params(axis="x", labelrotation=90)
+                axs[1, 1].set_xlim(-0.5, len(labels) - 0.5)
+                axs[1, 1].set_title(f"{civ.params.name} - Event Types")
+                axs[1, 1].set_xlabel("Event Type")
+                axs[1, 1].set_ylabel("Count")
+
+            plt.tight_layout()
         return fig
 
     def plot_universe_statistics(self):
@@ -387,51 +677,52 @@ class UniverseVisualizer:
         Returns:
             fig: The figure with multiple subplots
         """
-        stats_events = [e for e in self.universe.history if e["event"] == "statistics"]
-        if not stats_events:
+        universe = self.universe
+        if not universe.civilization_count_history:
             return None
 
-        # Extract data
-        dates = [e["date"] for e in stats_events]
-        civ_counts = [e["data"]["civilizations"] for e in stats_events]
-        pop_counts = [e["data"]["total_population"] for e in stats_events]
-        star_counts = [e["data"]["inhabited_stars"] for e in stats_events]
+        # The universe keeps the logged statistics as series of arrays
+        dates = universe.civilization_count_history.dates
+        civ_counts = universe.civilization_count_history.values
+        pop_counts = universe.population_history.values
+        star_counts = universe.inhabited_stars_history.values
 
         # Calculate percentage of inhabited stars
-        total_stars = len(self.universe.stars)
-        star_percentages = [count / total_stars * 100 for count in star_counts]
+        total_stars = len(universe.stars)
+        star_percentages = star_counts / total_stars * 100
 
         fig, axs = plt.subplots(3, 1, figsize=(10, 12), sharex=True)
 
-        # Civilization count
-        axs[0].plot(dates, civ_counts)
-        axs[0].set_title("Number of Civilizations")
-        axs[0].set_ylabel("Count")
-        axs[0].grid(True)
-
-        # Total population
-        axs[1].plot(dates, pop_counts)
-        axs[1].set_title("Total Population")
-        axs[1].set_ylabel("Population")
-        axs[1].set_yscale("log")
-        axs[1].grid(True)
-
-        # Inhabited stars
-        axs[2].plot(dates, star_counts, label=f"Count (Total: {total_stars})")
-        ax2 = axs[2].twinx()
-        ax2.plot(dates, star_percentages, "r--", label="Percentage")
-        ax2.set_ylabel("Percentage (%)")
-        ax2.set_ylim(0, 100)
-
-        axs[2].set_title("Inhabited Stars")
-        axs[2].set_ylabel("Count")
-        axs[2].set_xlabel("Time")
-        axs[2].grid(True)
-
-        # Combine legends
-        lines1, labels1 = axs[2].get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        axs[2].legend(lines1 + lines2, labels1 + labels2, loc="upper left")
-
-        plt.tight_layout()
+        with _defer_draw(fig):
+            # Civilization count
+            axs[0].plot(dates, civ_counts)
+            axs[0].set_title("Number of Civilizations")
+            axs[0].set_ylabel("Count")
+            axs[0].grid(True)
+
+            # Total population
+            axs[1].plot(dates, pop_counts)
+            axs[1].set_title("Total Population")
+            axs[1].set_ylabel("Population")
+            axs[1].set_yscale("log")
+            axs[1].grid(True)
+
+            # Inhabited stars
+            axs[2].plot(dates, star_counts, label=f"Count (Total: {total_stars})")
+            ax2 = axs[2].twinx()
+            ax2.plot(dates, star_percentages, "r--", label="Percentage")
+            ax2.set_ylabel("Percentage (%)")
+            ax2.set_ylim(0, 100)
+
+            axs[2].set_title("Inhabited Stars")
+            axs[2].set_ylabel("Count")
+            axs[2].set_xlabel("Time")
+            axs[2].grid(True)
+
+            # Combine legends
+            lines1, labels1 = axs[2].get_legend_handles_labels()
+            lines2, labels2 = ax2.get_legend_handles_labels()
+            axs[2].legend(lines1 + lines2, labels1 + labels2, loc="upper left")
+
+            plt.tight_layout()
         return fig